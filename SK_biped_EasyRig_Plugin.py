@@ -43,13 +43,101 @@ import maya.OpenMayaMPx as omx
 import sys
 
 # necessary for Script
+from contextlib import contextmanager
 from functools import partial
+import math
 import maya.cmds as cmds
 import pymel.core as pm
 
 # Plug-in Name / to be function name
 kPluginCmdName = "sk_biped_EasyRig"
 
+# naming convention and locator templates, shared by every command call
+names = ("c_root", "c_hips", "c_spine_b", "c_spine_c", "c_chest", "c_neck", "c_head",
+         "l_thigh", "l_knee", "l_foot", "l_ball", "l_toe",
+         "l_clavicle", "l_shoulder", "l_elbow", "l_hand",
+         "l_thumb_a", "l_thumb_b", "l_thumb_c",
+         "l_pointer_a", "l_pointer_b", "l_pointer_c",
+         "l_middle_a", "l_middle_b", "l_middle_c",
+         "l_ring_a", "l_ring_b", "l_ring_c",
+         "l_pinkie_a", "l_pinkie_b", "l_pinkie_c",
+         "l_tip", "l_heel",
+         "r_thigh", "r_knee", "r_foot", "r_ball", "r_toe",
+         "r_clavicle", "r_shoulder", "r_elbow", "r_hand",
+         "r_thumb_a", "r_thumb_b", "r_thumb_c",
+         "r_pointer_a", "r_pointer_b", "r_pointer_c",
+         "r_middle_a", "r_middle_b", "r_middle_c",
+         "r_ring_a", "r_ring_b", "r_ring_c",
+         "r_pinkie_a", "r_pinkie_b", "r_pinkie_c",
+         "r_tip", "r_heel")
+
+# default coordinate template (T-Pose)
+d_coords = ((0, 0, 0), (0, 97.8, -3.1), (0, 109.4, -3.1), (0, 127, -3.1), (0, 148.8, -3.1), (0, 160.2, -1.4),
+            (0, 167.7, -1.4),
+            (17, 96.2, -1.2), (17, 53, -1.2), (17, 14, -7.9), (17, 2.9, 3.7), (17, 2.8, 9.6),
+            (2.6, 149.8, -1), (17.6, 149.8, -3.4), (47.9, 149.8, -5.9), (72.1, 149.8, -5.6),
+            (79.6, 149.8, 1.9), (83.1, 149.8, 5.4), (86.6, 149.8, 8.9),
+            (88, 149.8, -1), (93.3, 149.8, -1), (97.8, 149.8, -1),
+            (89.1, 149.8, -4.7), (94.7, 149.8, -4.7), (99.6, 149.8, -4.7),
+            (88, 149.8, -8.4), (93.3, 149.8, -8.4), (97.8, 149.8, -8.4),
+            (86.8, 149.8, -11.7), (90.3, 149.8, -11.7), (94.4, 149.8, -11.7),
+            (17, 0, 9.8), (17, 0, -11.2),
+            (-17, 96.2, -1.2), (-17, 53, -1.2), (-17, 14, -7.9), (-17, 2.9, 3.7), (-17, 2.8, 9.6),
+            (-2.6, 149.8, -1), (-17.6, 149.8, -3.4), (-47.9, 149.8, -5.9), (-72.1, 149.8, -5.6),
+            (-79.6, 149.8, 1.9), (-83.1, 149.8, 5.4), (-86.6, 149.8, 8.9),
+            (-88, 149.8, -1), (-93.3, 149.8, -1), (-97.8, 149.8, -1),
+            (-89.1, 149.8, -4.7), (-94.7, 149.8, -4.7), (-99.6, 149.8, -4.7),
+            (-88, 149.8, -8.4), (-93.3, 149.8, -8.4), (-97.8, 149.8, -8.4),
+            (-86.8, 149.8, -11.7), (-90.3, 149.8, -11.7), (-94.4, 149.8, -11.7),
+            (-17, 0, 9.8), (-17, 0, -11.2))
+
+# mannequin coordinates template (A-Pose)
+coords = ((0, 0, 0), (0, 97.8, -3.1), (0, 107.7, 0), (0, 127, -2.2), (0, 149.8, -9.1), (0, 160.2, -3.4),
+          (0, 167.7, -1.7),
+          (9.2, 96.2, -1.2), (13.3, 53.2, -1.2), (17.1, 14.4, -7.9), (17.1, 3, 6.9), (17.1, 2.7, 13),
+          (5.2, 149.8, -6.1), (17.6, 149.8, -10), (37.1, 126.6, -12.2), (56.8, 111.9, -0.3),
+          (57.7, 107.5, 3.8), (57.6, 105.5, 7.1), (57.8, 102.2, 9.6),
+          (63, 103.7, 6.7), (64.7, 100.1, 8.2), (65.3, 96.8, 8.9),
+          (64.5, 103.5, 4.4), (66.5, 99.9, 5.7), (67.5, 96.1, 6.5),
+          (64.6, 103, 2.2), (66.6, 99.2, 2.9), (67.4, 96, 3.5),
+          (64.1, 103, -0.1), (66, 100, 0.2), (67, 97.2, 0.4),
+          (15.9, 0.4, 13.9), (17.8, 0.4, -13.9),
+          (-9.2, 96.2, -1.2), (-13.3, 53.2, -1.2), (-17.1, 14.4, -7.9), (-17.1, 3, 6.9), (-17.1, 2.7, 13),
+          (-5.2, 149.8, -6.1), (-17.6, 149.8, -10), (-37.1, 126.6, -12.2), (-56.8, 111.9, -0.3),
+          (-57.7, 107.5, 3.8), (-57.6, 105.5, 7.1), (-57.8, 102.2, 9.6),
+          (-63, 103.7, 6.7), (-64.7, 100.1, 8.2), (-65.3, 96.8, 8.9),
+          (-64.5, 103.5, 4.4), (-66.5, 99.9, 5.7), (-67.5, 96.1, 6.5),
+          (-64.6, 103, 2.2), (-66.6, 99.2, 2.9), (-67.4, 96, 3.5),
+          (-64.1, 103, -0.1), (-66, 100, 0.2), (-67, 97.2, 0.4),
+          (-15.8, 0.4, 13.9), (-17.8, 0.4, -13.9))
+
+# window texts, built once when the module loads instead of on every window open
+# about_texts - (separator height above, ((label, font), ...)) per paragraph of the "About" window
+about_texts = ((15, (("This plug-in tool is designed to help rig a bipedal creature for\ngame animation purposes inside Autedesk Maya 2023+. It operates\nwith PyMel and the Maya Python API 1.0.", "plainLabelFont"),)),
+               (12, (("This program was built within a bachelors project. As this plug-in\nhandles itself as a custom script for Autodesk Maya, it is marked\nas free softwar: You can redistribute and/or modify it.", "plainLabelFont"),
+                     ("This program is distributed in the hope that it will be useful,\nbut without any warranty.", "plainLabelFont"))),
+               (12, (("Author: Suzanne Knoop", "plainLabelFont"),
+                     ("E-Mail: suzanne.tamara@gmail.com", "plainLabelFont"),
+                     ("Last Update: 01/29/2024", "plainLabelFont"),
+                     ("Version: 0.0.2", "plainLabelFont"))),
+               (15, (("Known Issues:", "boldLabelFont"),
+                     ("* 'Reset to Skeleton' doesn't reset the hip translation attributes\n   after restart", "plainLabelFont"))))
+
+# help_texts - (separators above as (style, height), button header, description) per entry of the "Help" window
+help_texts = (((("in", 10),), "Pose Dropdown Menu:", "Preset for the to be created locators.\nA-Pose is adjusted to the UE5 Male Mannequin."),
+              ((("none", 10),), "Hierarchy Dropdown Menu:", "Acts as preset and interactive function.\n'Locators in Hierarchy' puts locators in hierachial order.\n'Locators Solo' sets locators as unrelated objects."),
+              ((("none", 10),), "Create Locators Button:", "Creates Locators with given presets.\nLocators follow a bipedal structure.\nThe structure is aimed to be optimized for game development."),
+              ((("none", 10),), "Mirror Buttons:", "Mirrors locator translation and rotation to the other side.\nEvery locator from one side will be mirrored to the other.\nThey can be mirrored from left and right, respectively."),
+              ((("single", 15),), "Create Skeleton Button:", "Creates a joint hierarchy based on the preexisting locator positions.\n* Basic XYZ orientations with mostly mirrored behaviour\n* Thumb X rotations usually need to be adjusted"),
+              ((("none", 10),), "Create IK Controls Button:", "Creates a separate, to be manipuleted IK joint skeleton.\nCreates respective spine, arm and leg IK controller.\n* Additional FK controls for neck, head and fingers\n* Tip, ball and heel attributes for foot controls\n* Advanced twist controls, adjust if spine is twisted"),
+              ((("none", 10),), "Local Rotation Axes Toggle:", "Toggles the Local Rotation Axes display on all visible objects of the rig groups."),
+              ((("none", 10),), "Reset to Locators Button:", "Deletes everything the tool created, except the locator group.\n*Locator positions won't reset."),
+              ((("none", 10),), "Reset to Skeleton Button:", "Deletes the controls unter grp_control_rig, returning to the base skeleton.\n*Any animations and controller movements will be reversed."),
+              ((("single", 10), ("single", 10)), "Root Bone Textfield:", "Field to write the name of the first joint of the to be bound hierarchy."),
+              ((("none", 10),), "Mesh Textfield:", "Field to write the name of the to be skinned mesh."),
+              ((("none", 10),), "Bind Skin Button:", "Skin mesh to hierarchy from the texfields.\n*Bind Method - Closest in Hierarchy\n*Skinning Method - Dual-Quaternion\n*Max Influences - 5"),
+              ((("none", 10),), "Unbind Skin Button:", "Deletes the skinCluster of the written mesh.\n*Also deletes the skin wheights."))
+
 
 # command class
 class SK_RT(omx.MPxCommand):
@@ -63,86 +151,48 @@ class SK_RT(omx.MPxCommand):
         """
         arrays:
             names - general convention for calling and creating objects
+            loc_names / jnt_names / ik_names - prefixed object names, aligned with names index
+            ctrl_names / hdl_names / null_names - prefixed controller, handle and null group names, same index
             coords - coordinates of initial locator positions, aligned with names index
+            names / coords / d_coords are read-only module-level tuples, built once when the plug-in loads
             jnts - strings to call joints
+            jnt_objs - MObjects of jnts, aligned with jnts index, stay valid through renaming and reparenting
             og_root_pos - root and hip positions for 'Reset to Skeleton', filled during 'Create Skeleton'
+            lock_attrs - transform attribute names for lock_attr, one axis tuple per trans_check index
 
             ik_jnts_check - list of all ik joints to check their existence
-            l_fingers - names intervall for left side fingers
-            r_fingers - names intervall for right side fingers
             basic_ctrl_grp - controller with standard setup (position/orientation directly on to be controlled object)
+            ctrl_colors - (controller, color) pairs queued by the curve functions, applied in one pass
             null_grp - all controller null / offset groups
-            full_ctrl_grp - all controller
+            full_ctrl_grp - all controller, one-element list [controller name] per null group (listRelatives result)
+            crv_protos - prototype curve per controller shape, duplicated instead of rebuilt, reset with every rig
+            grp_paths - full DAG paths of grp_rig_system / grp_controls, resolved once when the group is created
+            jnt_arrays / ctrl_arrays - all arrays filled by 'Create Skeleton' / 'Create IK Controls', cleared as one
         """
 
-        names = ["c_root", "c_hips", "c_spine_b", "c_spine_c", "c_chest", "c_neck", "c_head",
-                 "l_thigh", "l_knee", "l_foot", "l_ball", "l_toe",
-                 "l_clavicle", "l_shoulder", "l_elbow", "l_hand",
-                 "l_thumb_a", "l_thumb_b", "l_thumb_c",
-                 "l_pointer_a", "l_pointer_b", "l_pointer_c",
-                 "l_middle_a", "l_middle_b", "l_middle_c",
-                 "l_ring_a", "l_ring_b", "l_ring_c",
-                 "l_pinkie_a", "l_pinkie_b", "l_pinkie_c",
-                 "l_tip", "l_heel",
-                 "r_thigh", "r_knee", "r_foot", "r_ball", "r_toe",
-                 "r_clavicle", "r_shoulder", "r_elbow", "r_hand",
-                 "r_thumb_a", "r_thumb_b", "r_thumb_c",
-                 "r_pointer_a", "r_pointer_b", "r_pointer_c",
-                 "r_middle_a", "r_middle_b", "r_middle_c",
-                 "r_ring_a", "r_ring_b", "r_ring_c",
-                 "r_pinkie_a", "r_pinkie_b", "r_pinkie_c",
-                 "r_tip", "r_heel"]
-
-        # default coordinate template (T-Pose)
-        d_coords = [[0, 0, 0], [0, 97.8, -3.1], [0, 109.4, -3.1], [0, 127, -3.1], [0, 148.8, -3.1], [0, 160.2, -1.4],
-                    [0, 167.7, -1.4],
-                    [17, 96.2, -1.2], [17, 53, -1.2], [17, 14, -7.9], [17, 2.9, 3.7], [17, 2.8, 9.6],
-                    [2.6, 149.8, -1], [17.6, 149.8, -3.4], [47.9, 149.8, -5.9], [72.1, 149.8, -5.6],
-                    [79.6, 149.8, 1.9], [83.1, 149.8, 5.4], [86.6, 149.8, 8.9],
-                    [88, 149.8, -1], [93.3, 149.8, -1], [97.8, 149.8, -1],
-                    [89.1, 149.8, -4.7], [94.7, 149.8, -4.7], [99.6, 149.8, -4.7],
-                    [88, 149.8, -8.4], [93.3, 149.8, -8.4], [97.8, 149.8, -8.4],
-                    [86.8, 149.8, -11.7], [90.3, 149.8, -11.7], [94.4, 149.8, -11.7],
-                    [17, 0, 9.8], [17, 0, -11.2],
-                    [-17, 96.2, -1.2], [-17, 53, -1.2], [-17, 14, -7.9], [-17, 2.9, 3.7], [-17, 2.8, 9.6],
-                    [-2.6, 149.8, -1], [-17.6, 149.8, -3.4], [-47.9, 149.8, -5.9], [-72.1, 149.8, -5.6],
-                    [-79.6, 149.8, 1.9], [-83.1, 149.8, 5.4], [-86.6, 149.8, 8.9],
-                    [-88, 149.8, -1], [-93.3, 149.8, -1], [-97.8, 149.8, -1],
-                    [-89.1, 149.8, -4.7], [-94.7, 149.8, -4.7], [-99.6, 149.8, -4.7],
-                    [-88, 149.8, -8.4], [-93.3, 149.8, -8.4], [-97.8, 149.8, -8.4],
-                    [-86.8, 149.8, -11.7], [-90.3, 149.8, -11.7], [-94.4, 149.8, -11.7],
-                    [-17, 0, 9.8], [-17, 0, -11.2]]
-
-        # mannequin coordinates template (A-Pose)
-        coords = [[0, 0, 0], [0, 97.8, -3.1], [0, 107.7, 0], [0, 127, -2.2], [0, 149.8, -9.1], [0, 160.2, -3.4],
-                  [0, 167.7, -1.7],
-                  [9.2, 96.2, -1.2], [13.3, 53.2, -1.2], [17.1, 14.4, -7.9], [17.1, 3, 6.9], [17.1, 2.7, 13],
-                  [5.2, 149.8, -6.1], [17.6, 149.8, -10], [37.1, 126.6, -12.2], [56.8, 111.9, -0.3],
-                  [57.7, 107.5, 3.8], [57.6, 105.5, 7.1], [57.8, 102.2, 9.6],
-                  [63, 103.7, 6.7], [64.7, 100.1, 8.2], [65.3, 96.8, 8.9],
-                  [64.5, 103.5, 4.4], [66.5, 99.9, 5.7], [67.5, 96.1, 6.5],
-                  [64.6, 103, 2.2], [66.6, 99.2, 2.9], [67.4, 96, 3.5],
-                  [64.1, 103, -0.1], [66, 100, 0.2], [67, 97.2, 0.4],
-                  [15.9, 0.4, 13.9], [17.8, 0.4, -13.9],
-                  [-9.2, 96.2, -1.2], [-13.3, 53.2, -1.2], [-17.1, 14.4, -7.9], [-17.1, 3, 6.9], [-17.1, 2.7, 13],
-                  [-5.2, 149.8, -6.1], [-17.6, 149.8, -10], [-37.1, 126.6, -12.2], [-56.8, 111.9, -0.3],
-                  [-57.7, 107.5, 3.8], [-57.6, 105.5, 7.1], [-57.8, 102.2, 9.6],
-                  [-63, 103.7, 6.7], [-64.7, 100.1, 8.2], [-65.3, 96.8, 8.9],
-                  [-64.5, 103.5, 4.4], [-66.5, 99.9, 5.7], [-67.5, 96.1, 6.5],
-                  [-64.6, 103, 2.2], [-66.6, 99.2, 2.9], [-67.4, 96, 3.5],
-                  [-64.1, 103, -0.1], [-66, 100, 0.2], [-67, 97.2, 0.4],
-                  [-15.8, 0.4, 13.9], [-17.8, 0.4, -13.9]]
-
         locs = []
         jnts = []
+        jnt_objs = []
         og_root_pos = []
         # used for controller
         ik_jnts_check = []
-        l_fingers = names[16:31]
-        r_fingers = names[42:57]
         basic_ctrl_grp = []
+        ctrl_colors = []
         null_grp = []
         full_ctrl_grp = []
+        crv_protos = {}
+        grp_paths = {}
+        jnt_arrays = (jnts, jnt_objs, og_root_pos)
+        ctrl_arrays = (ik_jnts_check, basic_ctrl_grp, ctrl_colors, null_grp, full_ctrl_grp, crv_protos)
+        # prefixed object names, built once instead of concatenating in every loop
+        loc_names = ["loc_" + n for n in names]
+        jnt_names = ["jnt_" + n for n in names]
+        ik_names = ["ik_" + n for n in names]
+        ctrl_names = ["ctrl_" + n for n in names]
+        hdl_names = ["hdl_" + n for n in names]
+        null_names = ["grp_null_" + n for n in names]
+        lock_attrs = ((".translateX", ".translateY", ".translateZ"), (".rotateX", ".rotateY", ".rotateZ"),
+                      (".scaleX", ".scaleY", ".scaleZ"))
 
         '''
         Function:
@@ -156,77 +206,277 @@ class SK_RT(omx.MPxCommand):
         '''
 
         def object_check(var_string):
-            var_check = pm.ls(var_string)
-            if not pm.objExists(var_string):
+            if not cmds.objExists(var_string):
                 raise Exception(f"!!! Error: '{var_string}' doesn't exist.")
             else:
-                if len(var_check) > 1:
+                if len(cmds.ls(var_string)) > 1:
                     raise Exception(f"!!! Error: More than one object called '{var_string}' exist.")
 
         def non_object_check(non_var_string):
-            if pm.objExists(non_var_string):
+            if cmds.objExists(non_var_string):
                 raise Exception(f"!!! Error: '{non_var_string}' already exists.")
 
         '''
         Function:
-            lock specific transforms
+            check existence of a list of objectnames with one ls call, compare the result against the list
+            bulk_object_check - raise error if any object is not existent or more than one exist
+            bulk_non_object_check - raise error if any object exists
+        Vars:
+            var_list / non_var_list - objects to be checked
+            found - short names of all matches, duplicates appear more than once
+        Result:
+            raise errors if objects (don't) exist, listing all of them at once
+        '''
+
+        def bulk_object_check(var_list):
+            found = [f.split("|")[-1] for f in cmds.ls(var_list)]
+            missing = [v for v in var_list if v not in found]
+            if missing:
+                raise Exception(f"!!! Error: {missing} don't exist.")
+            if len(found) > len(set(found)):
+                doubles = sorted({f for f in found if found.count(f) > 1})
+                raise Exception(f"!!! Error: More than one object called {doubles} exist.")
+
+        def bulk_non_object_check(non_var_list):
+            existing = cmds.ls(non_var_list)
+            if existing:
+                raise Exception(f"!!! Error: {existing} already exist.")
+
+        '''
+        Function:
+            resolve an attribute name to its MPlug through an MSelectionList
+        Vars:
+            plug_name - "object.attribute" string
+        Result:
+            MPlug, ready to be used in a DG/DAG modifier
+        '''
+
+        def get_plug(plug_name):
+            plug_sel = om.MSelectionList()
+            plug_sel.add(plug_name)
+            plug = om.MPlug()
+            plug_sel.getPlug(0, plug)
+            return plug
+
+        '''
+        Function:
+            resolve an object name to its MDagPath through an MSelectionList
+        Vars:
+            dag_name - object name
+        Result:
+            MDagPath, gives access to the node MObject and its world matrix
+        '''
+
+        def get_dag(dag_name):
+            dag_sel = om.MSelectionList()
+            dag_sel.add(dag_name)
+            dag_path = om.MDagPath()
+            dag_sel.getDagPath(0, dag_path)
+            return dag_path
+
+        '''
+        Function:
+            read the world position of an object from the world matrix of its MDagPath
+            replaces joint/xform position queries, no command is evaluated
+        Vars:
+            pos_name - object name
+        Result:
+            [x, y, z] world position
+        '''
+
+        def world_pos(pos_name):
+            pos_mtx = om.MTransformationMatrix(get_dag(pos_name).inclusiveMatrix())
+            pos_vec = pos_mtx.getTranslation(om.MSpace.kWorld)
+            return [pos_vec.x, pos_vec.y, pos_vec.z]
+
+        '''
+        Function:
+            snap an object onto another one by copying its world matrix, or world translation only
+            replaces the temporary parent-/pointConstraint + delete, no constraint node is created
+        Vars:
+            dst - object to be moved
+            src - reference object, unscaled
+            rotate - False copies the translation only, like a pointConstraint
+        Result:
+            dst at the world position (and orientation) of src
+        '''
+
+        def snap(dst, src, rotate=True):
+            if rotate:
+                cmds.xform(dst, worldSpace=True, matrix=cmds.xform(src, query=True, worldSpace=True, matrix=True))
+            else:
+                cmds.xform(dst, worldSpace=True,
+                           translation=cmds.xform(src, query=True, worldSpace=True, translation=True))
+
+        '''
+        Function:
+            bake scale and rotation straight into the CVs of a curve without history
+            same result as scale + rotate + makeIdentity, transform stays untouched
+        Vars:
+            crv - curve transform
+            scale - xyz scale, applied first
+            rot_deg - xyz rotation in degrees
+        Result:
+            reshaped curve with zeroed transforms
+        '''
+
+        def bake_xform(crv, scale=(1, 1, 1), rot_deg=(0, 0, 0)):
+            crv_dag = get_dag(crv)
+            crv_dag.extendToShape()
+            crv_fn = om.MFnNurbsCurve(crv_dag)
+            rot_mtx = om.MEulerRotation(*[math.radians(r) for r in rot_deg]).asMatrix()
+            cvs = om.MPointArray()
+            crv_fn.getCVs(cvs, om.MSpace.kObject)
+            for i in range(cvs.length()):
+                cvs.set(om.MPoint(cvs[i].x * scale[0], cvs[i].y * scale[1], cvs[i].z * scale[2]) * rot_mtx, i)
+            crv_fn.setCVs(cvs, om.MSpace.kObject)
+            crv_fn.updateCurve()
+
+        '''
+        Function:
+            lock specific transforms on a list of objects
             if t in trans_check true then t in transforms locked
+            lock is set on every axis, keyable only when key is given
         Vars:
-            transforms - transform attributes
-            axis - transform axes
-            obj - assigned object
+            lock_attrs - transform attributes, 3 axes per trans_check index
+            l_objs - assigned objects, existence is ensured by the callers
             trans_check - list of bools for transform indecies [bool, bool, bool] 
             lock - boolean for lock/unlock
-            key - boolean for un-/keyable
+            key - boolean for un-/keyable, None leaves the keyable state untouched
         Result: 
-            uniquely locked transform attributes on given object
+            uniquely locked transform attributes on given objects
         '''
 
-        def lock_attr(l_obj, trans_check, lock, key):
-            transforms = [".translate", ".rotate", ".scale"]
-            axis = ["X", "Y", "Z"]
-            object_check(l_obj)
-            for a in axis:
-                for t in range(len(transforms)):
-                    if trans_check[t]:
-                        pm.setAttr(l_obj + transforms[t] + a, lock=lock, keyable=key)
+        def lock_attr(l_objs, trans_check, lock, key=None):
+            for l_obj in l_objs:
+                for (t, want) in enumerate(trans_check):
+                    if not want:
+                        continue
+                    for a in lock_attrs[t]:
+                        if key is None:
+                            cmds.setAttr(l_obj + a, lock=lock)
+                        else:
+                            cmds.setAttr(l_obj + a, lock=lock, keyable=key)
 
         '''
         Function
             recolor object with overrideColor index
         Vars:
-            re_object - to be recolored object
+            re_object - to be recolored object, existence is checked by the caller
             recol - color | red - 13, blue - 6, yellow - 17, dark red - 4
         Result:
             recolored object
         '''
 
         def recolor(re_obj, recol):
-            object_check(re_obj)
-            crv = pm.PyNode(re_obj)
-            crv.overrideEnabled.set(1)
-            crv.overrideColor.set(recol)
+            cmds.setAttr(re_obj + ".overrideEnabled", 1)
+            cmds.setAttr(re_obj + ".overrideColor", recol)
+
+        '''
+        Function:
+            switch the scene to centimeter only when it is not already in cm
+            a redundant currentUnit edit still notifies and dirties the whole scene
+        Result:
+            scene working in cm
+        '''
+
+        def unit_check():
+            if cmds.currentUnit(query=True, linear=True) != "cm":
+                cmds.currentUnit(linear="cm")
+
+        '''
+        Function:
+            empty every array of the given build stages
+            a stage is only refilled by its own builder, so clearing never triggers a rebuild
+        Vars:
+            stages - jnt_arrays and/or ctrl_arrays
+        Result:
+            empty arrays, ready for the next build of these stages
+        '''
+
+        def clear_arrays(*stages):
+            for stage in stages:
+                for array in stage:
+                    array.clear()
 
         '''
         Function:
-            create, move and scale locators at coords / d_coords positions
-            colorize locators
+            context manager for bulk scene construction
+            disable undo without flushing the queue, switch evaluation manager and cycle check off,
+            suspend viewport refresh
+            restore previous states afterwards, even if the build raises an error
+            force one refresh, so the result is shown
+            wraps whole top level builders only, nesting would resume the refresh too early
+        Vars:
+            undo_state - undo state before the build
+            em_mode - evaluation manager mode before the build
+            cycle_state - cycle check state before the build
+        Result:
+            builder commands run without per-command undo, evaluation manager and redraw overhead
+        '''
+
+        @contextmanager
+        def fast_build():
+            undo_state = cmds.undoInfo(query=True, state=True)
+            em_mode = cmds.evaluationManager(query=True, mode=True)[0]
+            cycle_state = cmds.cycleCheck(query=True, evaluation=True)
+            cmds.undoInfo(stateWithoutFlush=False)
+            cmds.evaluationManager(mode="off")
+            cmds.cycleCheck(evaluation=False)
+            cmds.refresh(suspend=True)
+            try:
+                yield
+            finally:
+                cmds.refresh(suspend=False)
+                cmds.cycleCheck(evaluation=cycle_state)
+                cmds.evaluationManager(mode=em_mode)
+                cmds.undoInfo(stateWithoutFlush=undo_state)
+                cmds.refresh(force=True)
+
+        '''
+        Function:
+            queue all locator transforms and shapes in one MDagModifier, create them with a single doIt()
+            move locators at coords / d_coords positions
+            scale and colorize locators in the same pass: hand locators 2cm, heel and tips 3cm and red, rest 5cm and yellow
             append to locs list
         Vars:
-            name_list - names
+            name_list - loc_names
             coord_list - coords / d_coords
+            dag_mod - modifier holding every locator creation
+            loc_nodes - MObjects of the created locator transforms
+            hand_idx - indices of the finger locators
+            teel_idx - indices of the heel and tip locators
         Result: 
             unconnected, yellow locators that form a basic bipedal structure
         '''
 
         def loc_creation(name_list, coord_list):
-            for (i, c) in zip(name_list, coord_list):
-                non_object_check("loc_" + i)
-                loc = pm.spaceLocator(name=("loc_" + i))
-                pm.xform(translation=c)
-                pm.scale(5, 5, 5)
-                pm.select(clear=True)
-                recolor(loc, 17)
+            bulk_non_object_check(name_list)
+
+            dag_mod = om.MDagModifier()
+            loc_nodes = []
+            for i in name_list:
+                loc_node = dag_mod.createNode("transform")
+                dag_mod.renameNode(loc_node, i)
+                dag_mod.renameNode(dag_mod.createNode("locator", loc_node), i + "Shape")
+                loc_nodes.append(loc_node)
+            dag_mod.doIt()
+
+            hand_idx = set(range(16, 31)) | set(range(42, 57))
+            teel_idx = {31, 32, 57, 58}
+            for (n, (c, loc_node)) in enumerate(zip(coord_list, loc_nodes)):
+                if n in hand_idx:
+                    (loc_scale, loc_color) = (2, 17)
+                elif n in teel_idx:
+                    (loc_scale, loc_color) = (3, 4)
+                else:
+                    (loc_scale, loc_color) = (5, 17)
+                loc_fn = om.MFnTransform(loc_node)
+                loc_fn.setTranslation(om.MVector(*c), om.MSpace.kTransform)
+                for a in ["X", "Y", "Z"]:
+                    loc_fn.findPlug("scale" + a).setDouble(loc_scale)
+                loc = loc_fn.name()
+                recolor(loc, loc_color)
                 locs.append(loc)
 
             print("!!! Operation: Locator Creation successful.")
@@ -236,69 +486,128 @@ class SK_RT(omx.MPxCommand):
             mirror one locator side to the other one
             source locator from scene
             set side (l/r), get objects of side
-            get position and rotation from side object
-            set position (x*-1) and rotation from other side object
+            read world position and rotation of all side objects through their DAG paths, without xform queries
+            set position (x*-1) and rotation (y/z*-1) on other side object, one xform per locator
         Vars:
             side - l (left)/ r (right)
             mirror_locs = l/r objects of locs
             other - opposite of l/r side
+            mir_sel - selection list of mirror_locs to get their DAG paths
+            mir_xforms - world position and rotation (degrees) for each of mirror_locs
         Result:
             mirrored given side to the other
         '''
 
         def loc_mirror(side, *args):
-            m_locs = []
-            for n_obj in names:
-                side_obj = "loc_" + n_obj
-                object_check(side_obj)
-                m_locs.append(side_obj)
-            if side is "l":
-                mirror_locs = m_locs[7:33]
+            if side == "l":
+                mirror_locs = loc_names[7:33]
                 other = "r"
-            elif side is "r":
-                mirror_locs = m_locs[33:59]
+            elif side == "r":
+                mirror_locs = loc_names[33:59]
                 other = "l"
             else:
                 raise Exception("Wrong parameter")
+            # both sides, sources and targets
+            bulk_object_check(loc_names[7:59])
+
+            mir_sel = om.MSelectionList()
             for mir_loc in mirror_locs:
-                loc_pos = pm.xform(mir_loc, query=True, worldSpace=True, translation=True)
-                loc_rot = pm.xform(mir_loc, query=True, worldSpace=True, rotation=True)
-                other_suff = mir_loc.split("loc_" + side)
-                other_loc = "loc_" + other + other_suff[1]
-                pm.xform(other_loc, worldSpace=True, translation=[loc_pos[0] * -1, loc_pos[1], loc_pos[2]],
-                         rotation=[loc_rot[0], loc_rot[1] * -1, loc_rot[2] * -1])
+                mir_sel.add(mir_loc)
+            mir_dag = om.MDagPath()
+            mir_xforms = []
+            for m in range(mir_sel.length()):
+                mir_sel.getDagPath(m, mir_dag)
+                mir_mtx = om.MTransformationMatrix(mir_dag.inclusiveMatrix())
+                loc_pos = mir_mtx.getTranslation(om.MSpace.kWorld)
+                loc_rot = mir_mtx.eulerRotation()
+                mir_xforms.append(([loc_pos.x, loc_pos.y, loc_pos.z],
+                                   [math.degrees(loc_rot.x), math.degrees(loc_rot.y), math.degrees(loc_rot.z)]))
+
+            for (mir_loc, (loc_pos, loc_rot)) in zip(mirror_locs, mir_xforms):
+                other_loc = "loc_" + other + mir_loc.removeprefix("loc_" + side)
+                cmds.xform(other_loc, worldSpace=True, translation=[loc_pos[0] * -1, loc_pos[1], loc_pos[2]],
+                           rotation=[loc_rot[0], loc_rot[1] * -1, loc_rot[2] * -1])
 
         '''
         Function:
-            separating hand locator from locs array
-            downscaling hand locator to 2cm
+            queue every (child, parent) pair in one MDagModifier, reparent with a single doIt()
+            skip children that already sit under their parent
+            reparentNode works relative, so world matrices are read before and local matrices restored after
+            joints keep rotate untouched (zero during the build) and take the local rotation as jointOrient
+            joint pairs get parent.scale -> child.inverseScale like a regular parent command
+        Vars:
+            pairs - list of (child, parent) name strings, every caller already passes plain strings
+            dag_objs - MObjects of all involved objects
+            world_mats - world matrices of all involved objects before parenting
+            moved - pairs that are actually reparented
+        Result: 
+            children parented under their parents, world positions kept
+        '''
+
+        def reparent_batch(pairs):
+            dag_paths = {n: get_dag(n) for pair in pairs for n in pair}
+            dag_objs = {n: dag_paths[n].node() for n in dag_paths}
+            world_mats = {n: dag_paths[n].inclusiveMatrix() for n in dag_paths}
+
+            dag_mod = om.MDagModifier()
+            moved = []
+            for (c, p) in pairs:
+                if om.MFnDagNode(dag_objs[c]).parent(0) == dag_objs[p]:
+                    continue
+                dag_mod.reparentNode(dag_objs[c], dag_objs[p])
+                if dag_objs[c].hasFn(om.MFn.kJoint) and dag_objs[p].hasFn(om.MFn.kJoint):
+                    dag_mod.connect(om.MFnDependencyNode(dag_objs[p]).findPlug("scale"),
+                                    om.MFnDependencyNode(dag_objs[c]).findPlug("inverseScale"))
+                moved.append((c, p))
+            dag_mod.doIt()
+
+            for (c, p) in moved:
+                local_mat = om.MTransformationMatrix(world_mats[c] * world_mats[p].inverse())
+                if dag_objs[c].hasFn(om.MFn.kJoint):
+                    jnt_fn = om.MFnTransform(dag_objs[c])
+                    jnt_fn.setTranslation(local_mat.getTranslation(om.MSpace.kTransform), om.MSpace.kTransform)
+                    local_rot = local_mat.eulerRotation()
+                    for (a, r) in zip(["X", "Y", "Z"], [local_rot.x, local_rot.y, local_rot.z]):
+                        jnt_fn.findPlug("jointOrient" + a).setDouble(r)
+                else:
+                    om.MFnTransform(dag_objs[c]).set(local_mat)
+
+        '''
+        Function:
+            queue every (child, parent) pair by parent, one multi-object cmds.parent per parent
+            for GUI callbacks outside fast_build, the parent command stays on the undo queue
+            unlike the MDagModifier of reparent_batch
+            skip children that already sit under their parent
+        Vars:
+            pairs - list of (child, parent) name strings
+            by_parent - children per parent, in order of first appearance
+        Result:
+            children parented under their parents, world positions kept, undoable
         '''
 
-        def handScale():
-            hand_locs = locs[16:57]
-            del hand_locs[15:26]
-            for hl in hand_locs:
-                pm.select(hl)
-                pm.scale(2, 2, 2)
+        def reparent_undoable(pairs):
+            by_parent = {}
+            for (c, p) in pairs:
+                if p not in (cmds.listRelatives(c, parent=True) or []):
+                    by_parent.setdefault(p, []).append(c)
+            for (p, children) in by_parent.items():
+                cmds.parent(children, p)
 
         '''
         Function:
             iterating through a 2D array
-            parenting 2. element to 1. element in the list
-            cycle stops when no further parent exists
+            parenting 2. element to 1. element in the list, all chains in one reparent call
         Vars:
             list - loc_grps
-            grp[loc] - 2. element / child
-            grp[loc-1] - 1. element / parent
+            reparent - reparent_batch inside fast_build, reparent_undoable for GUI callbacks
+            grp[i] - 2. element / child
+            grp[i-1] - 1. element / parent
         Result: 
-            hierarchy chains of objects of the list
+            hierarchy chains of objects of the list, world positions kept
         '''
 
-        def parenting(list):
-            for grp in list:
-                locator_amount = len(grp)
-                for loc in range(1, locator_amount):
-                    pm.parent(grp[loc], grp[loc - 1])
+        def parenting(list, reparent=reparent_batch):
+            reparent([(grp[i], grp[i - 1]) for grp in list for i in range(1, len(grp))])
 
         '''
         Function:
@@ -307,18 +616,16 @@ class SK_RT(omx.MPxCommand):
             if optionMenu menuItem 1 (hierarchy) selected, create loc_grps, precaution unlock,  parent them to hierarchy, lock
             if optionMenu menuItem 2 (solo) selected, precaution unlock, parent each to "grp_loc_rig", lock
         Vars:
+            reparent - reparent_batch inside fast_build, reparent_undoable when called from the optionMenu
             proxy_locs - same as locs but flexible, relys on viewport instead of script internal variables
             loc_grps - 2D array for locator: spine, l/r arm, l/r leg, l/r single fingers
         Result:
             depending on the optionMenu selection the locator structure switches between hierarchy and individual locator
         '''
 
-        def loc_solo_hierarchy():
-            proxy_locs = []
-
-            for loc_name in names:
-                object_check("loc_" + loc_name)
-                proxy_locs.append("loc_" + loc_name)
+        def loc_solo_hierarchy(reparent=reparent_batch):
+            proxy_locs = list(loc_names)
+            bulk_object_check(proxy_locs)
 
             if pm.optionMenu("hierarchy_option", query=True, select=True) == 1:
 
@@ -328,49 +635,45 @@ class SK_RT(omx.MPxCommand):
                             proxy_locs[48:51],
                             proxy_locs[51:54], proxy_locs[54:57]]
 
-                for ll in proxy_locs:
-                    lock_attr(ll, [0, 0, 1], 0, 1)
+                lock_attr(proxy_locs, [0, 0, 1], 0, 1)
 
-                parenting(loc_grps)
+                parenting(loc_grps, reparent)
 
                 # parenting limb groups into compound hierarchy
-                pm.parent(proxy_locs[31], proxy_locs[32], proxy_locs[9])
-                pm.parent(proxy_locs[57], proxy_locs[58], proxy_locs[35])
-                pm.parent(proxy_locs[16], proxy_locs[19], proxy_locs[22], proxy_locs[25], proxy_locs[28],
-                          proxy_locs[15])
-                pm.parent(proxy_locs[42], proxy_locs[45], proxy_locs[48], proxy_locs[51], proxy_locs[54],
-                          proxy_locs[41])
-                pm.parent(proxy_locs[1], proxy_locs[7], proxy_locs[12], proxy_locs[33], proxy_locs[38], proxy_locs[0])
+                compound_pairs = [(proxy_locs[c], proxy_locs[9]) for c in [31, 32]]
+                compound_pairs += [(proxy_locs[c], proxy_locs[35]) for c in [57, 58]]
+                compound_pairs += [(proxy_locs[c], proxy_locs[15]) for c in [16, 19, 22, 25, 28]]
+                compound_pairs += [(proxy_locs[c], proxy_locs[41]) for c in [42, 45, 48, 51, 54]]
+                compound_pairs += [(proxy_locs[c], proxy_locs[0]) for c in [1, 7, 12, 33, 38]]
+                compound_pairs.append((proxy_locs[0], "grp_loc_rig"))
+                reparent(compound_pairs)
 
-                pm.parent(proxy_locs[0], "grp_loc_rig")
+                lock_attr(proxy_locs, [0, 0, 1], 1, 1)
 
-                for ll in proxy_locs:
-                    lock_attr(ll, [0, 0, 1], 1, 1)
-
-                pm.select(clear=True)
+                cmds.select(clear=True)
 
             if pm.optionMenu("hierarchy_option", query=True, select=True) == 2:
-                for solo_l in proxy_locs:
-                    lock_attr(solo_l, [0, 0, 1], 0, 1)
-                for hier_loc in proxy_locs:
-                    pm.parent(hier_loc, "grp_loc_rig")
-                for solo_l in proxy_locs:
-                    lock_attr(solo_l, [0, 0, 1], 1, 0)
+                lock_attr(proxy_locs, [0, 0, 1], 0, 1)
+                reparent([(hier_loc, "grp_loc_rig") for hier_loc in proxy_locs])
+                lock_attr(proxy_locs, [0, 0, 1], 1, 0)
 
-                pm.select(clear=True)
+                cmds.select(clear=True)
 
-        # loc_solo_hierarchy for button
+        # loc_solo_hierarchy for button, runs outside fast_build and has to stay undoable
+        # one undo chunk, so a single undo reverts the unlock, parenting and lock together
         def loc_solo_hierarchy_button(*args):
-            loc_solo_hierarchy()
+            cmds.undoInfo(openChunk=True)
+            try:
+                loc_solo_hierarchy(reparent_undoable)
+            finally:
+                cmds.undoInfo(closeChunk=True)
 
         '''
         Function:
             complete locator hierarchy
-            create group for locator
+            create group for locator, skipSelect keeps the selection untouched
             clear locs for safety
             create locator with d_coords or coords depending on selected optionMenu Item 1 (A-Pose) or else (T-Pose)
-            rescale hand locator
-            recolor/ rescale heel and tips
             create locator hierarchy or individual locators inside group depending on selected optionMenu Item
         Result: 
             bipedal locator hierarchy with locked scale attributes
@@ -378,55 +681,57 @@ class SK_RT(omx.MPxCommand):
         '''
 
         def create_locator_hierarchy(*args):
-            pm.currentUnit(linear="cm")
+            with fast_build():
+                unit_check()
 
-            non_object_check("grp_loc_rig")
-            pm.group(name="grp_loc_rig", world=True, empty=True)
+                non_object_check("grp_loc_rig")
+                cmds.createNode("transform", name="grp_loc_rig", skipSelect=True)
 
-            locs.clear()
+                locs.clear()
 
-            if pm.optionMenu("pose_option", query=True, select=True) == 1:
-                loc_creation(names, coords)
-            else:
-                loc_creation(names, d_coords)
-
-            handScale()
-
-            # recolor heel and tip joints
-            for teel in locs[31:33] + locs[57:59]:
-                recolor(teel, 4)
-                pm.select(teel)
-                pm.scale(3, 3, 3)
+                if pm.optionMenu("pose_option", query=True, select=True) == 1:
+                    loc_creation(loc_names, coords)
+                else:
+                    loc_creation(loc_names, d_coords)
 
-            loc_solo_hierarchy()
+                loc_solo_hierarchy()
 
-            print("!!! Operation: Locator Rig Creation successful.")
+                print("!!! Operation: Locator Rig Creation successful.")
 
         '''
         Function:
-            iterate through names to create named joints
+            iterate through names indices to create named joints, skipping tip and heel (reverse foot only)
+            queue all joints in one MDagModifier, create them with a single doIt()
             position joints at corresponding locator positions
-            remove obsolete joints from outliner and array
             append joints to jnts array
         Vars:
             jnts - array for created joints
+            bone_idx - names indices without tip and heel
+            dag_mod - modifier holding every joint creation
+            jnt_nodes - MObjects of the created joints
         Result: 
             single joints on corresponding locator positions
         '''
 
         def jnt_creation():
-            for name in names:
-                object_check("loc_" + name)
-                non_object_check("jnt_" + name)
-                pm.select(clear=True)
-                jnt = pm.joint(name="jnt_" + name)
-                pm.delete(pm.pointConstraint(("loc_" + name), jnt))
-                jnts.append(jnt)
-            jnts.remove("jnt_l_tip")
-            jnts.remove("jnt_l_heel")
-            jnts.remove("jnt_r_tip")
-            jnts.remove("jnt_r_heel")
-            pm.delete("jnt_r_heel", "jnt_r_tip", "jnt_l_heel", "jnt_l_tip")
+            bone_idx = [n for n in range(len(names)) if not names[n].endswith(("_tip", "_heel"))]
+            bulk_object_check([loc_names[n] for n in bone_idx])
+            bulk_non_object_check([jnt_names[n] for n in bone_idx])
+
+            dag_mod = om.MDagModifier()
+            jnt_nodes = []
+            for n in bone_idx:
+                jnt_node = dag_mod.createNode("joint")
+                dag_mod.renameNode(jnt_node, jnt_names[n])
+                jnt_nodes.append(jnt_node)
+            dag_mod.doIt()
+
+            for (n, jnt_node) in zip(bone_idx, jnt_nodes):
+                loc_pos = cmds.xform(loc_names[n], query=True, worldSpace=True, translation=True)
+                jnt_fn = om.MFnTransform(jnt_node)
+                jnt_fn.setTranslation(om.MVector(*loc_pos), om.MSpace.kTransform)
+                jnts.append(jnt_fn.name())
+                jnt_objs.append(jnt_node)
 
             print("!!! Operation: Joint Creation successful.")
 
@@ -434,21 +739,22 @@ class SK_RT(omx.MPxCommand):
         Function:
             iterate through jnts array to orient separate limb hierarchies: spine, l/r arm, l/r leg, l/r single fingers
             orient last joint to none, to let if follow the same direction as previous joint
+            leaf joints come from the known hierarchy instead of a listRelatives query per joint
         Vars:
             j_array - jnts
             orientJ - orientJoint "xyz" - standard
             sao - secondaryAxisOrient "y-up" - standard
+            leaves - joints without child joints at the time of orientation
         Result: 
             xyz orientation with y-up as secondary axis on every limb hierarchy
         '''
 
-        def jnt_orientation(j_array, orientJ, sao):
+        def jnt_orientation(j_array, orientJ, sao, leaves):
             for or_j in j_array:
-                pm.select(or_j)
-                if pm.listRelatives(allDescendents=True, children=True, type='joint'):
-                    pm.joint(edit=True, orientJoint=orientJ, secondaryAxisOrient=sao, zeroScaleOrient=True)
+                if or_j in leaves:
+                    cmds.joint(or_j, edit=True, orientJoint="none")
                 else:
-                    pm.joint(edit=True, orientJoint="none")
+                    cmds.joint(or_j, edit=True, orientJoint=orientJ, secondaryAxisOrient=sao, zeroScaleOrient=True)
 
         '''
         Function:
@@ -457,95 +763,97 @@ class SK_RT(omx.MPxCommand):
             parent limbs to compound hierarchy, group in outliner, hide locator group
         Vars:
             jnt_grps - 2D array for joints: spine, l/r arm, l/r leg, l/r individual fingers
-            r_leg_or - orientation of right knee
+            jnt_leaves - unparented root and last joint of every jnt_grps chain
             jnts - indices for joints
+            jnt_objs - cached joint MObjects, used for direct plug edits
         Result: 
             Ready to be exported/worked with joint-based bipedal skeleton
         '''
 
         def create_joint_hierarchy(*args):
-            pm.currentUnit(linear="cm")
-
-            jnts.clear()
-
-            jnt_creation()
-
-            jnt_grps = [jnts[1:7], jnts[7:12], jnts[12:16], jnts[16:19], jnts[19:22], jnts[22:25], jnts[25:28],
-                        jnts[28:31],
-                        jnts[31:36], jnts[36:40], jnts[40:43], jnts[43:46], jnts[46:49], jnts[49:52], jnts[52:55]]
-
-            parenting(jnt_grps)
-
-            jnt_orientation(jnts, "xyz", "yup")
-
-            # fixes of default orientation for orientation continuity
-            # Left Arm and Hand - mirror
-            jnt_orientation(jnt_grps[2], "xyz", "ydown")
-            jnt_orientation(jnt_grps[3], "xyz", "ydown")
-            jnt_orientation(jnt_grps[4], "xyz", "ydown")
-            jnt_orientation(jnt_grps[5], "xyz", "ydown")
-            jnt_orientation(jnt_grps[6], "xyz", "ydown")
-            jnt_orientation(jnt_grps[7], "xyz", "ydown")
-
-            # Left Thigh
-            pm.joint(jnts[7], jnts[8], edit=True, orientJoint="xyz", secondaryAxisOrient="zup",
-                     zeroScaleOrient=True)
-
-            # Right Thigh
-            pm.joint(jnts[31], edit=True, orientJoint="xyz", secondaryAxisOrient="zdown", zeroScaleOrient=True)
-
-            # Right Foot
-            pm.joint(jnts[33], edit=True, orientJoint="xyz", children=True, secondaryAxisOrient="ydown",
-                     zeroScaleOrient=True)
-            pm.joint(jnts[35], edit=True, orientJoint="none")
-
-            # Right Knee orientation fix
-            pm.parent(jnts[33], world=True)
-            r_leg_or = pm.joint(jnts[32], query=True, orientation=True)
-            pm.joint(jnts[32], edit=True, orientation=[0, r_leg_or[1], r_leg_or[2]])
-            pm.parent(jnts[33], jnts[32])
-
-            # Neck/Head
-            pm.joint(jnts[4], edit=True, children=True, orientJoint="xyz", secondaryAxisOrient="ydown",
-                     zeroScaleOrient=True)
-            pm.joint(jnts[6], edit=True, orientJoint="none")
-
-            # Hip
-            pm.joint(jnts[1], edit=True, children=False, orientJoint="xyz", secondaryAxisOrient="ydown",
-                     zeroScaleOrient=True)
-
-            # parent limb hierarchies to compound skeletal hierarchy
-            # hips/thighs
-            pm.parent(jnts[7], jnts[31], jnts[1])
-            # chest/clavicles
-            pm.parent(jnts[12], jnts[36], jnts[4])
-            # l_hand/fingers
-            pm.parent(jnts[16], jnts[19], jnts[22], jnts[25], jnts[28], jnts[15])
-            # r_hand/fingers
-            pm.parent(jnts[40], jnts[43], jnts[46], jnts[49], jnts[52], jnts[39])
-            # root/hips
-            pm.parent(jnts[1], jnts[0])
-
-            # clean-up outliner
-            non_object_check("grp_bind_rig")
-            pm.group(name="grp_bind_rig", empty=True)
-            pm.parent(jnts[0], "grp_bind_rig")
-            lock_attr("grp_bind_rig", [1, 1, 1], 1, 1)
-
-            pm.hide("grp_loc_rig")
-            pm.select(clear=True)
-
-            # disable mirror buttons
-            pm.button("b_l_mirror", edit=True, enable=False)
-            pm.button("b_r_mirror", edit=True, enable=False)
-
-            # get hip / root joint position for reset
-            root_jnt_pos = pm.joint(jnts[0], query=True, position=True, absolute=True)
-            hip_jnt_pos = pm.joint(jnts[1], query=True, position=True, absolute=True)
-            og_root_pos.append(root_jnt_pos)
-            og_root_pos.append(hip_jnt_pos)
-
-            print("!!! Operation: Joint Hierarchy Creation successful.")
+            with fast_build():
+                unit_check()
+
+                clear_arrays(jnt_arrays)
+
+                jnt_creation()
+
+                jnt_grps = [jnts[1:7], jnts[7:12], jnts[12:16], jnts[16:19], jnts[19:22], jnts[22:25], jnts[25:28],
+                            jnts[28:31],
+                            jnts[31:36], jnts[36:40], jnts[40:43], jnts[43:46], jnts[46:49], jnts[49:52], jnts[52:55]]
+
+                parenting(jnt_grps)
+
+                jnt_leaves = {jnts[0]} | {grp[-1] for grp in jnt_grps}
+                jnt_orientation(jnts, "xyz", "yup", jnt_leaves)
+
+                # fixes of default orientation for orientation continuity
+                # Left Arm and Hand - mirror
+                jnt_orientation(jnt_grps[2], "xyz", "ydown", jnt_leaves)
+                jnt_orientation(jnt_grps[3], "xyz", "ydown", jnt_leaves)
+                jnt_orientation(jnt_grps[4], "xyz", "ydown", jnt_leaves)
+                jnt_orientation(jnt_grps[5], "xyz", "ydown", jnt_leaves)
+                jnt_orientation(jnt_grps[6], "xyz", "ydown", jnt_leaves)
+                jnt_orientation(jnt_grps[7], "xyz", "ydown", jnt_leaves)
+
+                # Left Thigh
+                cmds.joint(jnts[7], jnts[8], edit=True, orientJoint="xyz", secondaryAxisOrient="zup",
+                           zeroScaleOrient=True)
+
+                # Right Thigh
+                cmds.joint(jnts[31], edit=True, orientJoint="xyz", secondaryAxisOrient="zdown", zeroScaleOrient=True)
+
+                # Right Foot
+                cmds.joint(jnts[33], edit=True, orientJoint="xyz", children=True, secondaryAxisOrient="ydown",
+                           zeroScaleOrient=True)
+                cmds.joint(jnts[35], edit=True, orientJoint="none")
+
+                # Right Knee orientation fix - zero joint orient x directly on the cached node
+                cmds.parent(jnts[33], world=True)
+                om.MFnDependencyNode(jnt_objs[32]).findPlug("jointOrientX").setDouble(0)
+                cmds.parent(jnts[33], jnts[32])
+
+                # Neck/Head
+                cmds.joint(jnts[4], edit=True, children=True, orientJoint="xyz", secondaryAxisOrient="ydown",
+                           zeroScaleOrient=True)
+                cmds.joint(jnts[6], edit=True, orientJoint="none")
+
+                # Hip
+                cmds.joint(jnts[1], edit=True, children=False, orientJoint="xyz", secondaryAxisOrient="ydown",
+                           zeroScaleOrient=True)
+
+                # clean-up outliner
+                non_object_check("grp_bind_rig")
+                cmds.createNode("transform", name="grp_bind_rig", skipSelect=True)
+
+                # parent limb hierarchies to compound skeletal hierarchy
+                # hips/thighs
+                compound_pairs = [(jnts[c], jnts[1]) for c in [7, 31]]
+                # chest/clavicles
+                compound_pairs += [(jnts[c], jnts[4]) for c in [12, 36]]
+                # l_hand/fingers
+                compound_pairs += [(jnts[c], jnts[15]) for c in [16, 19, 22, 25, 28]]
+                # r_hand/fingers
+                compound_pairs += [(jnts[c], jnts[39]) for c in [40, 43, 46, 49, 52]]
+                # root/hips
+                compound_pairs.append((jnts[1], jnts[0]))
+                compound_pairs.append((jnts[0], "grp_bind_rig"))
+                reparent_batch(compound_pairs)
+
+                lock_attr(["grp_bind_rig"], [1, 1, 1], 1)
+
+                cmds.hide("grp_loc_rig")
+                cmds.select(clear=True)
+
+                # disable mirror buttons
+                pm.button("b_l_mirror", edit=True, enable=False)
+                pm.button("b_r_mirror", edit=True, enable=False)
+
+                # get hip / root joint position for reset
+                og_root_pos.append(world_pos(jnts[0]))
+                og_root_pos.append(world_pos(jnts[1]))
+
+                print("!!! Operation: Joint Hierarchy Creation successful.")
 
         '''
         Function:
@@ -562,48 +870,48 @@ class SK_RT(omx.MPxCommand):
 
         def create_control_rig():
             # check if original joints are there
-            for check_jnt in names[0:31] + names[33:57]:
-                object_check("jnt_" + check_jnt)
+            bulk_object_check(jnt_names[0:31] + jnt_names[33:57])
 
-            # check if ik joint names already exist
-            for ik_jnt_check in names:
-                non_object_check("ik_" + ik_jnt_check)
+            # check if ik joint and group names already exist
+            bulk_non_object_check(ik_names + ["grp_control_rig", "grp_ik_rig", "grp_rig_system"])
 
-            pm.duplicate("jnt_" + names[0], returnRootsOnly=True)
+            cmds.duplicate(jnt_names[0], returnRootsOnly=True)
 
-            pm.select("jnt_" + names[0] + "1", hierarchy=True, replace=True)
-            ik_jnts = pm.ls(selection=True)
+            cmds.select(jnt_names[0] + "1", hierarchy=True, replace=True)
+            ik_jnts = cmds.ls(selection=True, long=True)
 
-            for ik_j in ik_jnts:
-                ik_suf = ik_j.split("jnt_")
-                ik_joint = pm.rename(ik_j, "ik_" + ik_suf[1])
-                ik_jnts_check.append(ik_joint)
+            # rename from the leaves up, so the long names of the not yet renamed parents stay valid
+            ik_renamed = []
+            for ik_j in reversed(ik_jnts):
+                ik_suf = ik_j.rpartition("|")[2].removeprefix("jnt_")
+                ik_renamed.append(cmds.rename(ik_j, "ik_" + ik_suf))
+            ik_jnts_check.extend(reversed(ik_renamed))
 
             # cut the 1 from ik_root1
-            pm.rename("ik_c_root1", "ik_c_root")
+            ik_jnts_check[0] = cmds.rename("ik_c_root1", "ik_c_root")
 
             # create groups
-            non_object_check("grp_control_rig")
-            pm.group(name="grp_control_rig", world=True, empty=True)
+            cmds.group(name="grp_control_rig", world=True, empty=True)
 
-            non_object_check("grp_ik_rig")
-            pm.group(name="grp_ik_rig", parent="grp_control_rig", empty=True)
+            cmds.group(name="grp_ik_rig", parent="grp_control_rig", empty=True)
 
             # parent root and legs to ik group
-            non_object_check("grp_rig_system")
-            pm.group(name="grp_rig_system", parent="grp_control_rig", empty=True)
-            pm.parent(ik_jnts_check[0], ik_jnts_check[45], ik_jnts_check[50], "grp_ik_rig")
-            pm.select(clear=True)
+            grp_paths["rig_system"] = get_dag(cmds.group(name="grp_rig_system", parent="grp_control_rig",
+                                                         empty=True)).fullPathName()
+            cmds.parent(ik_jnts_check[0], ik_jnts_check[45], ik_jnts_check[50], "grp_ik_rig")
+            cmds.select(clear=True)
 
             print("!!! Operation: IK Rig Creation successful.")
 
         '''
         Function: 
             connect translate and rotate attributes of each jnt_joint to the corresponding ik_joint
-            connect same attributes to the respective root joints afterwards, as they are left out in vars
+            all connections are queued in one MDGModifier and made with a single doIt()
+            parent constrain the thigh joints afterwards, as they are left out in vars
         Vars:
             jnts_con - list of 'names' joints except thigh joints
             ik_con - list of 'names' IK joints except thigh joints
+            dg_mod - modifier holding every connection
         Result: 
             ik skeleton drives translates and rotates of jnt skeleton
             -> ik skeleton can be modified while jnt skeleton stays untouched
@@ -611,29 +919,20 @@ class SK_RT(omx.MPxCommand):
 
         def connect_rig():
             # create arrays for hierarchies - why do they iterate twice (one without and one with clavicles)
-            ik_con = []
-            jnts_con = []
+            ik_con = ik_names[0:7] + ik_names[8:31] + ik_names[34:57]
+            jnts_con = jnt_names[0:7] + jnt_names[8:31] + jnt_names[34:57]
+            bulk_object_check(ik_con + jnts_con)
 
-            for jnt_con_j in names[0:7] + names[8:31] + names[34:57]:
-                jnt_con_name = "jnt_" + jnt_con_j
-                ik_con_name = "ik_" + jnt_con_j
-                jnts_con.append(jnt_con_name)
-                ik_con.append(ik_con_name)
-
-            # connect hierarchies
+            # connect hierarchies, root included
+            dg_mod = om.MDGModifier()
             for (ikc, jc) in zip(ik_con, jnts_con):
-                object_check(ikc)
-                object_check(jc)
-                pm.connectAttr(ikc + ".translate", jc + ".translate", force=True)
-                pm.connectAttr(ikc + ".rotate", jc + ".rotate", force=True)
-
-            # manual connection as root isn't a descendant, thus not listed in the _con arrays
-            cmds.connectAttr("ik_c_root.translate", "jnt_c_root.translate", force=True)
-            cmds.connectAttr("ik_c_root.rotate", "jnt_c_root.rotate", force=True)
+                dg_mod.connect(get_plug(ikc + ".translate"), get_plug(jc + ".translate"))
+                dg_mod.connect(get_plug(ikc + ".rotate"), get_plug(jc + ".rotate"))
+            dg_mod.doIt()
 
             # parent constraint leg bases to another
-            pm.parentConstraint("ik_" + names[7], "jnt_" + names[7])
-            pm.parentConstraint("ik_" + names[33], "jnt_" + names[33])
+            cmds.parentConstraint(ik_names[7], jnt_names[7])
+            cmds.parentConstraint(ik_names[33], jnt_names[33])
 
             print("!!! Operation: IK to Bind Rig Connection successful.")
 
@@ -641,6 +940,7 @@ class SK_RT(omx.MPxCommand):
         Function:
             create IK handle
             calculates start joint based on called solver (sc - parent, rp - grandparent)
+            parent the returned handle to grp_rig_system
         Vars:
             end - end-effector
             solv - IK solver (sc - singleChain, rp - rotatePlane)
@@ -649,14 +949,13 @@ class SK_RT(omx.MPxCommand):
         '''
 
         def create_ik(end, solv):
-            suf = end.split("ik_")
-            startRP = pm.listRelatives(pm.listRelatives(end, parent=True), parent=True)
-            startSC = pm.listRelatives(end, parent=True)
-            if solv is "sc":
-                pm.ikHandle(name="hdl_" + suf[1], solver="ikSCsolver", startJoint=startSC[0], endEffector=end)
-            if solv is "rp":
-                pm.ikHandle(name="hdl_" + suf[1], solver="ikRPsolver", startJoint=startRP[0], endEffector=end)
-            pm.parent("hdl_" + suf[1], "grp_rig_system")
+            suf = end.removeprefix("ik_")
+            start = cmds.listRelatives(end, parent=True, fullPath=True)[0]
+            if solv == "rp":
+                start = cmds.listRelatives(start, parent=True, fullPath=True)[0]
+            hdl = cmds.ikHandle(name="hdl_" + suf, solver="ik" + solv.upper() + "solver", startJoint=start,
+                                endEffector=end)[0]
+            cmds.parent(hdl, grp_paths["rig_system"])
 
         '''
         Function:
@@ -679,25 +978,24 @@ class SK_RT(omx.MPxCommand):
 
         def setupPV(prnt, hdl, trans):
             # create PV setup with locator
-            prnt_s = prnt.split("ik_")
-            grp = pm.group(empty=True, parent=prnt, absolute=False, name=("grp_null_PV_" + prnt_s[1]))
-            pm.parent(world=True)
-            pm.parent(pm.spaceLocator(name="loc_PV_" + prnt_s[1]), grp, relative=True)
-            pm.poleVectorConstraint(("loc_PV_" + prnt_s[1]), hdl)
-
-            # setup 2 locator to fix the IK wiggle when PV positions
-            loc_pj = pm.spaceLocator()
-            loc_pi = pm.spaceLocator()
-            pm.parent(loc_pj, ("jnt_" + prnt_s[1]), relative=True)
-            pm.parent(loc_pi, prnt, relative=True)
-            pm.xform(loc_pj, loc_pi, grp, translation=trans, relative=True, objectSpace=True, worldSpaceDistance=True)
+            prnt_s = prnt.removeprefix("ik_")
+            grp = cmds.createNode("transform", name="grp_null_PV_" + prnt_s, parent=prnt, skipSelect=True)
+            grp = cmds.parent(grp, world=True)[0]
+            cmds.parent(cmds.spaceLocator(name="loc_PV_" + prnt_s)[0], grp, relative=True)
+            cmds.poleVectorConstraint("loc_PV_" + prnt_s, hdl)
+
+            # setup 2 locator to fix the IK wiggle when PV positions, names kept as strings from here on
+            loc_pj = cmds.parent(cmds.spaceLocator()[0], "jnt_" + prnt_s, relative=True)[0]
+            loc_pi = cmds.parent(cmds.spaceLocator()[0], prnt, relative=True)[0]
+            cmds.xform(loc_pj, loc_pi, grp, translation=trans, relative=True, objectSpace=True,
+                       worldSpaceDistance=True)
 
             # create temporary hierarchy to correctly align PV through loc_pj and loc_pi positions
-            pm.parent(loc_pj, loc_pi, world=True)
-            pm.parent(grp, loc_pi)
-            pm.delete(pm.parentConstraint(loc_pj, loc_pi, maintainOffset=False))
-            pm.parent(grp, "grp_rig_system")
-            pm.delete(loc_pj, loc_pi)
+            (loc_pj, loc_pi) = cmds.parent(loc_pj, loc_pi, world=True)
+            grp = cmds.parent(grp, loc_pi)[0]
+            snap(loc_pi, loc_pj)
+            cmds.parent(grp, grp_paths["rig_system"])
+            cmds.delete(loc_pj, loc_pi)
 
         '''
         Function:
@@ -706,10 +1004,12 @@ class SK_RT(omx.MPxCommand):
             parent locator and leg IK handles
             group reverse rig
             -> toe moves ball when used, both move with heel when used, ball just moves itself
+            positions are copied with snap() instead of temporary constraints
         Vars:
             feet - foot locator of locs in correct sequence for reverse rig
             ik_feet - list of created ik locator
             ik_feet_grp - 2D array with l/r ik locator
+            foot_grps - l/r null groups of the reverse foot
             names - indices for object names
         Result: 
             reverse foot setup for both feet, ready to be installed into ctrls
@@ -718,161 +1018,194 @@ class SK_RT(omx.MPxCommand):
 
         def reverseFoot():
             # create locators - l/r heel>tip>ball
-            feet = ["loc_" + names[32], "loc_" + names[31], "loc_" + names[10], "loc_" + names[58],
-                    "loc_" + names[57], "loc_" + names[36]]
-            ik_feet = []
-            for fl in feet:
-                non_object_check("ik_" + fl)
-                f_loc = pm.spaceLocator(name=("ik_" + fl))
-                pm.delete(pm.pointConstraint(fl, f_loc))
-                ik_feet.append(f_loc)
+            feet = [loc_names[32], loc_names[31], loc_names[10], loc_names[58], loc_names[57], loc_names[36]]
+            foot_grps = [null_names[32], null_names[58]]
+            bulk_non_object_check(["ik_" + fl for fl in feet] + foot_grps)
+
+            ik_feet = [cmds.spaceLocator(name="ik_" + fl)[0] for fl in feet]
+            for (fl, f_loc) in zip(feet, ik_feet):
+                snap(f_loc, fl, rotate=False)
 
             # group into lists for parenting
-            ik_feet_grp = []
-            ik_feet_grp.append(ik_feet[0:3])
-            ik_feet_grp.append(ik_feet[3:7])
+            ik_feet_grp = [ik_feet[0:3], ik_feet[3:6]]
 
             parenting(ik_feet_grp)
 
-            # parentIK handles to locator structure
-            pm.parent("hdl_" + names[35], "hdl_" + names[36], "ik_loc_" + names[36])
-            pm.parent("hdl_" + names[9], "hdl_" + names[10], "ik_loc_" + names[10])
-            pm.parent("hdl_" + names[37], "ik_loc_" + names[58])
-            pm.parent("hdl_" + names[11], "ik_loc_" + names[32])
-
-            # create and parent to groups
-            non_object_check("grp_null_" + names[32])
-            pm.group(name="grp_null_" + names[32], empty=True)
-            pm.delete(pm.parentConstraint("ik_loc_" + names[32], "grp_null_" + names[32]))
+            # parentIK handles to locator structure in one reparent batch
+            reparent_batch([(hdl_names[35], ik_feet[5]), (hdl_names[36], ik_feet[5]),
+                            (hdl_names[9], ik_feet[2]), (hdl_names[10], ik_feet[2]),
+                            (hdl_names[37], ik_feet[3]), (hdl_names[11], ik_feet[0])])
 
-            non_object_check("grp_null_" + names[58])
-            pm.group(name="grp_null_" + names[58], empty=True)
-            pm.delete(pm.parentConstraint("ik_loc_" + names[58], "grp_null_" + names[58]))
+            # create groups directly inside grp_rig_system on the heel locators and parent the reverse foot into them
+            for (f_grp, f_heel) in zip(foot_grps, [ik_feet[0], ik_feet[3]]):
+                cmds.createNode("transform", name=f_grp, parent=grp_paths["rig_system"], skipSelect=True)
+                snap(f_grp, f_heel)
+                cmds.parent(f_heel, f_grp)
 
-            pm.parent("ik_loc_" + names[32], "grp_null_" + names[32])
-            pm.parent("ik_loc_" + names[58], "grp_null_" + names[58])
+            print("!!! Operation: Reverse Foot Setup successful.")
 
-            pm.parent("grp_null_" + names[32], "grp_null_" + names[58], "grp_rig_system")
+        '''
+        Function:
+            freeze transforms of called objects
+            delete non-deformer history of called objects
+            one makeIdentity and one delete call for the whole list
+        Vars:
+            fdh_objs - list of called objects
+        '''
 
-            print("!!! Operation: Reverse Foot Setup successful.")
+        def freezeDelHistory(fdh_objs):
+            bulk_object_check(fdh_objs)
+            cmds.makeIdentity(fdh_objs, apply=True, translate=True, rotate=True, scale=True)
+            cmds.delete(fdh_objs, constructionHistory=True)
 
         '''
         Function:
-            freeze transforms of called object
-            delete non-deformer history of called object
+            build each controller shape once as prototype inside hidden "grp_crv_prototypes"
+            duplicate the prototype for every further controller of the same shape
+            rename duplicate and its shape after the requested controller, move it to world
         Vars:
-            fdh_obj - called object
+            key - shape identifier in crv_protos
+            crv_name - name of the requested controller
+            build - function creating the shape with a given name, only called for the prototype
+        Result:
+            controller curve crv_name, identical to a freshly built one
         '''
 
-        def freezeDelHistory(fdh_obj):
-            object_check(fdh_obj)
-            pm.makeIdentity(fdh_obj, apply=True, translate=True, rotate=True, scale=True)
-            pm.delete(fdh_obj, constructionHistory=True)
-            pm.select(clear=True)
+        def crv_proto(key, crv_name, build):
+            if key not in crv_protos:
+                if not cmds.objExists("grp_crv_prototypes"):
+                    cmds.createNode("transform", name="grp_crv_prototypes", skipSelect=True)
+                    cmds.setAttr("grp_crv_prototypes.visibility", 0)
+                proto = "proto_" + crv_name
+                build(proto)
+                cmds.parent(proto, "grp_crv_prototypes")
+                crv_protos[key] = proto
+            crv_dup = cmds.duplicate(crv_protos[key], name=crv_name)[0]
+            cmds.rename(cmds.listRelatives(crv_dup, shapes=True, fullPath=True)[0], crv_name + "Shape")
+            cmds.parent(crv_dup, world=True)
 
         '''
         Functions:
-            adjusted controller curves for each limb, including recolor
+            adjusted controller curves for each limb
+            colors are only queued in ctrl_colors, nurbs_controller applies them after all curves exist
             crv_basic - nurbs circle, for fingers and neck
             hands_core - diamond shaped nurbs curve, for hands, root and centerOfMass
             feet_core - nurbs curve shaped to UE Mannequin, for feet and shoulderblades
             crv_kneel - pyramid shaped nurbs curve, for knees and elbows
             chest_core - organic, swung nurbs curve, for chest and head
             crv_spine_b / crv_spine_c - nurbs circle formed to corresponding torso partitions
+            static scale/rotate corrections are baked into the CVs with bake_xform()
+            name collisions are checked once up front in nurbs_controller
         Inside basic_ctrl_grp:
             crv_basic, crv_hands, crv_root, crv_centerOfMass, crv_chest, crv_head, crv_spineB, crv_spineC
         '''
 
         # basic circle
+        def basic_core(basic_name, b_scale):
+            pm.circle(name=basic_name, constructionHistory=False)
+            bake_xform(basic_name, scale=(b_scale, b_scale, b_scale), rot_deg=(0, 90, 0))
+
         def crv_basic(basic_name, b_scale, b_col):
-            non_object_check(basic_name)
-            crv = pm.circle(name=basic_name)
-            pm.scale(basic_name, b_scale, b_scale, b_scale)
-            pm.rotate(basic_name, 0, 90, 0)
-            recolor(basic_name, b_col)
-            freezeDelHistory(basic_name)
+            crv_proto(("basic", b_scale), basic_name, partial(basic_core, b_scale=b_scale))
+            ctrl_colors.append((basic_name, b_col))
             basic_ctrl_grp.append(basic_name)
 
         # hands core
         def hands_core(hands_core_name):
-            non_object_check(hands_core_name)
-            pm.curve(name=hands_core_name, degree=1, point=[(0, 0, -9), (-9, 0, 0), (0, 0, 9), (9, 0, 0), (0, 0, -9)],
-                     knot=[0, 1, 2, 3, 4])
+            crv_proto("hands", hands_core_name,
+                      lambda crv_n: pm.curve(name=crv_n, degree=1,
+                                             point=[(0, 0, -9), (-9, 0, 0), (0, 0, 9), (9, 0, 0), (0, 0, -9)],
+                                             knot=[0, 1, 2, 3, 4]))
 
         # hands
         def crv_hands(hands_name, h_col):
             hands_core(hands_name)
-            pm.rotate(hands_name, 0, 0, 90)
-            recolor(hands_name, h_col)
+            bake_xform(hands_name, rot_deg=(0, 0, 90))
+            ctrl_colors.append((hands_name, h_col))
             basic_ctrl_grp.append(hands_name)
 
         # root
         def crv_root(root_name):
             hands_core(root_name)
-            pm.scale(root_name, 5.8, 5.8, 5.8)
-            pm.rotate(root_name, 0, 0, 0)
-            recolor(root_name, 4)
+            bake_xform(root_name, scale=(5.8, 5.8, 5.8))
+            ctrl_colors.append((root_name, 4))
             basic_ctrl_grp.append(root_name)
 
         # center of mass
         def crv_centerOfMass(com_name):
             hands_core(com_name)
-            pm.scale(com_name, 2.9, 2.9, 2.9)
-            pm.rotate(com_name, 0, 0, 90)
-            recolor(com_name, 4)
+            bake_xform(com_name, scale=(2.9, 2.9, 2.9), rot_deg=(0, 0, 90))
+            ctrl_colors.append((com_name, 4))
             basic_ctrl_grp.append(com_name)
 
         # feet core
         def feet_core(feet_core_name):
-            non_object_check(feet_core_name)
-            pm.curve(name=feet_core_name, degree=3,
-                     point=[(-6.192026, 0, -7.222708), (-7.145403, 0, -1.658433), (-9.052156, 0, 9.470118),
-                            (-4.930124, 0, 14.939794), (7.070467, 0, 18.394924), (4.812628, 0, 1.483525),
-                            (6.788087, 0, -9.800724), (1.855148, 0, -17.409909), (-4.789274, 0, -17.035881),
-                            (-5.724442, 0, -10.493766), (-6.192026, 0, -7.222709)],
-                     knot=[0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8])
+            crv_proto("feet", feet_core_name,
+                      lambda crv_n: pm.curve(name=crv_n, degree=3,
+                                             point=[(-6.192026, 0, -7.222708), (-7.145403, 0, -1.658433),
+                                                    (-9.052156, 0, 9.470118), (-4.930124, 0, 14.939794),
+                                                    (7.070467, 0, 18.394924), (4.812628, 0, 1.483525),
+                                                    (6.788087, 0, -9.800724), (1.855148, 0, -17.409909),
+                                                    (-4.789274, 0, -17.035881), (-5.724442, 0, -10.493766),
+                                                    (-6.192026, 0, -7.222709)],
+                                             knot=[0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8]))
 
         # feet
         def crv_feet(feet_name, f_col):
             feet_core(feet_name)
-            recolor(feet_name, f_col)
+            ctrl_colors.append((feet_name, f_col))
 
         # shoulderblades
         def crv_shoulder(shoulder_name, s_col):
             feet_core(shoulder_name)
             pm.rotate(shoulder_name, 0, 15, 0, relative=True, objectSpace=True, forceOrderXYZ=True)
             pm.scale(shoulder_name, 1.222765, 1, 1, relative=True)
-            recolor(shoulder_name, s_col)
+            ctrl_colors.append((shoulder_name, s_col))
 
         # elbow/knee
         def crv_kneel(kneel_name, ke_col):
-            non_object_check(kneel_name)
-            pm.curve(name=kneel_name, degree=1,
-                     point=[(-4.469147, 0, -3.90705e-07), (-1.95353e-07, 0, 4.469147), (0, 8.938294, 0),
-                            (4.469147, 0, 0),
-                            (5.86058e-07, 0, -4.469147), (0, 8.938294, 0), (-4.469147, 0, -3.90705e-07),
-                            (5.86058e-07, 0, -4.469147), (4.469147, 0, 0), (-1.95353e-07, 0, 4.469147)],
-                     knot=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
-            recolor(kneel_name, ke_col)
+            crv_proto("kneel", kneel_name,
+                      lambda crv_n: pm.curve(name=crv_n, degree=1,
+                                             point=[(-4.469147, 0, -3.90705e-07), (-1.95353e-07, 0, 4.469147),
+                                                    (0, 8.938294, 0), (4.469147, 0, 0),
+                                                    (5.86058e-07, 0, -4.469147), (0, 8.938294, 0),
+                                                    (-4.469147, 0, -3.90705e-07), (5.86058e-07, 0, -4.469147),
+                                                    (4.469147, 0, 0), (-1.95353e-07, 0, 4.469147)],
+                                             knot=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+            ctrl_colors.append((kneel_name, ke_col))
 
         # chest core
         def chest_core(chest_core_name):
-            non_object_check(chest_core_name)
-            pm.circle(name=chest_core_name)
-            pm.rotate(chest_core_name, 90, 0, 0)
-            pm.scale(chest_core_name, 25, 25, 25, relative=True)
-            pm.makeIdentity(chest_core_name, apply=True, rotate=True, scale=True)
-            pm.select(chest_core_name + ".cv[1]", chest_core_name + ".cv[5]", replace=True)
-            pm.scale(1, 1, 0.657641, relative=True, pivot=(0, 142.343345, -4.855895))
-            pm.select(chest_core_name + ".cv[6]", chest_core_name + ".cv[0]", chest_core_name + ".cv[2]",
-                      chest_core_name + ".cv[4]", replace=True)
-            pm.move(0, -8.118699, 0, relative=True, objectSpace=True, worldSpaceDistance=True)
-            pm.select(chest_core_name + ".cv[3]", chest_core_name + ".cv[7]", replace=True)
-            pm.scale(0.780896, 0.780896, 0.780896, relative=True, pivot=(-1.019395, 0.569853, 0))
-            pm.move(0, -13.464986, 0, relative=True, objectSpace=True, worldSpaceDistance=True)
+            crv_proto("chest", chest_core_name, chest_shape)
+
+        def chest_shape(chest_core_name):
+            pm.circle(name=chest_core_name, constructionHistory=False)
+            bake_xform(chest_core_name, scale=(25, 25, 25), rot_deg=(90, 0, 0))
+
+            # reshape all CVs in one pass, the overlapping cv[8-10] of the periodic circle follow cv[0-2]
+            crv_dag = get_dag(chest_core_name)
+            crv_dag.extendToShape()
+            crv_fn = om.MFnNurbsCurve(crv_dag)
+            spans = crv_fn.numSpans()
+            cvs = om.MPointArray()
+            crv_fn.getCVs(cvs, om.MSpace.kObject)
+            for i in range(cvs.length()):
+                cv = om.MPoint(cvs[i])
+                if i % spans in (1, 5):
+                    # scale z by 0.657641 around pivot z -4.855895
+                    cv.z = -4.855895 + (cv.z + 4.855895) * 0.657641
+                elif i % spans in (3, 7):
+                    # scale by 0.780896 around pivot (-1.019395, 0.569853, 0), then move down
+                    cv.x = -1.019395 + (cv.x + 1.019395) * 0.780896
+                    cv.y = 0.569853 + (cv.y - 0.569853) * 0.780896 - 13.464986
+                    cv.z = cv.z * 0.780896
+                else:
+                    cv.y = cv.y - 8.118699
+                cvs.set(cv, i)
+            crv_fn.setCVs(cvs, om.MSpace.kObject)
+            crv_fn.updateCurve()
+
             pm.rotate(chest_core_name, 0, 0, 90, objectSpace=True)
-            recolor(chest_core_name, 17)
-            pm.select(clear=True)
 
         # chest
         def crv_chest(chest_name):
@@ -881,6 +1214,7 @@ class SK_RT(omx.MPxCommand):
             pm.rotate(chest_name, 0, 0, 43.5 + 28.4)
             pm.move(chest_name, -3.8, 3.5, 0, relative=True)
             pm.move(3.8, -3.5, 0, chest_name + ".scalePivot", chest_name + ".rotatePivot", relative=True)
+            ctrl_colors.append((chest_name, 17))
             basic_ctrl_grp.append(chest_name)
 
         # head
@@ -889,51 +1223,46 @@ class SK_RT(omx.MPxCommand):
             pm.scale(head_name, 0.52, 0.1, 0.4)
             pm.move(head_name, 9.1, 0, 0, relative=True)
             pm.move(-9.1, 0, 0, head_name + ".scalePivot", head_name + ".rotatePivot", relative=True)
+            ctrl_colors.append((head_name, 17))
             basic_ctrl_grp.append(head_name)
 
         # spine a/b
         def crv_spineB(spineB_name):
-            non_object_check(spineB_name)
-            pm.circle(name=spineB_name)
-            pm.scale(spineB_name, 20.3, 20.3, 17.6)
-            pm.rotate(spineB_name, 0, 90, 0)
-            recolor(spineB_name, 17)
+            pm.circle(name=spineB_name, constructionHistory=False)
+            bake_xform(spineB_name, scale=(20.3, 20.3, 17.6), rot_deg=(0, 90, 0))
+            ctrl_colors.append((spineB_name, 17))
             basic_ctrl_grp.append(spineB_name)
 
         def crv_spineC(spineC_name):
-            non_object_check(spineC_name)
-            pm.circle(name=spineC_name)
-            pm.scale(spineC_name, 22.9, 22.9, 20.3)
-            pm.rotate(spineC_name, 0, 90, 0)
+            pm.circle(name=spineC_name, constructionHistory=False)
+            bake_xform(spineC_name, scale=(22.9, 22.9, 20.3), rot_deg=(0, 90, 0))
             # rotZ -73.350
-            recolor(spineC_name, 17)
+            ctrl_colors.append((spineC_name, 17))
             basic_ctrl_grp.append(spineC_name)
 
         '''
         Function:
-            iterate through r_/l_fingers to create scaled crv_basic for each joint
+            iterate through right (42-56) / left (16-30) finger ctrl_names to create scaled crv_basic for each joint
         Result:
             size adjusted FK finger ctrls
         '''
 
         def crv_fingers():
             # create right finger ctrls
-            for rf in r_fingers:
-                non_object_check("ctrl_" + rf)
+            for rf in ctrl_names[42:57]:
                 if rf.endswith("_a"):
-                    crv_basic(("ctrl_" + rf), 2.2, 6)
+                    crv_basic(rf, 2.2, 6)
                 else:
-                    crv_basic(("ctrl_" + rf), 1.6, 6)
+                    crv_basic(rf, 1.6, 6)
             # create left finger ctrls
-            for lf in l_fingers:
-                non_object_check("ctrl_" + lf)
+            for lf in ctrl_names[16:31]:
                 if lf.endswith("_a"):
-                    crv_basic(("ctrl_" + lf), 2.2, 13)
+                    crv_basic(lf, 2.2, 13)
                 else:
-                    crv_basic(("ctrl_" + lf), 1.6, 13)
-                    # size adjustments for first 2 thumb ctrls
-            pm.xform("ctrl_" + names[16], "ctrl_" + names[17], "ctrl_" + names[42], "ctrl_" + names[43],
-                     scale=[1.5, 1.5, 1.5])
+                    crv_basic(lf, 1.6, 13)
+            # size adjustments for first 2 thumb ctrls
+            for n in [16, 17, 42, 43]:
+                cmds.setAttr(ctrl_names[n] + ".scale", 1.5, 1.5, 1.5, type="double3")
 
         '''
         Function:
@@ -950,18 +1279,16 @@ class SK_RT(omx.MPxCommand):
         Result:
             correctly positioned and oriented offset group with controller inside, controller stays zeroed out
             ctrl_jnt - used for c_jnt in feet_ctrl_position()
+            controller existence is checked once in nurbs_controller for all controllers
         '''
 
         # control grouping funktion mit ctrl_jnt aus gabe für pivot nutzung
         def ctrl_grp_prep(pref, g_ctrl):
-            object_check(g_ctrl)
-            pm.select(clear=True)
-            ctrls_grp = pm.group(name=("grp_null_" + g_ctrl))
-            ctrl_suf = g_ctrl.split("ctrl_")
-            ctrl_jnt = (pref + ctrl_suf[1])
-            pm.parent(g_ctrl, ctrls_grp)
-            pm.delete(pm.parentConstraint(ctrl_jnt, ctrls_grp))
-            pm.parent(ctrls_grp, "grp_controls")
+            ctrls_grp = cmds.createNode("transform", name="grp_null_" + g_ctrl, skipSelect=True)
+            ctrl_jnt = (pref + g_ctrl.removeprefix("ctrl_"))
+            cmds.parent(g_ctrl, ctrls_grp)
+            snap(ctrls_grp, ctrl_jnt)
+            cmds.parent(ctrls_grp, grp_paths["controls"])
             null_grp.append(ctrls_grp)
             return ctrl_jnt
 
@@ -975,7 +1302,6 @@ class SK_RT(omx.MPxCommand):
         def basic_ctrl_position():
             for ctrl in basic_ctrl_grp:
                 ctrl_grp_prep("ik_", ctrl)
-                freezeDelHistory(ctrl)
 
         '''
         Function:
@@ -984,29 +1310,26 @@ class SK_RT(omx.MPxCommand):
             rotate group to y zero to be parallel to ground
             get c_jnt position, set ctrl translation yz to 0 > centered on ground beneath ik joint
             set ctrl pivot to c_jnt translation
-            freezeDelHistory() to zero out transforms
         Vars:
             f_ctrl - controller name
             gx rot - group x rotation for mirrored parallel transforms
             gz rot - group z rotation for mirrored parallel transforms
             f_rot_corr - z rotation correction for left controller (180)
             c_jnt - ctrl_grp_prep() -> corresponding ik joint
-            jnt_pvt - query c_jnt -> returned ctrl_jnt (to be controlled object)
+            jnt_pvt - world position of c_jnt -> returned ctrl_jnt (to be controlled object)
         Result:
             foot controller inside an offset group at yz 0, beneath the corresponding ik joint
         '''
 
         def feet_ctrl_position(f_ctrl, gx_rot, gz_rot, f_rot_corr):
-            object_check(f_ctrl)
             # prepare group
             c_jnt = ctrl_grp_prep("ik_", f_ctrl)
             pm.rotate(("grp_null_" + f_ctrl), gx_rot, 0, gz_rot)
             # move ctrl and pivot
-            jnt_pvt = pm.joint(c_jnt, query=True, position=True)
+            jnt_pvt = world_pos(c_jnt)
             pm.xform(f_ctrl, worldSpace=True, translation=[jnt_pvt[0], 0, 0], rotation=[0, 0, f_rot_corr])
             pm.xform(f_ctrl, pivots=jnt_pvt, worldSpace=True)
             pm.parent(f_ctrl, ("grp_null_" + f_ctrl))
-            freezeDelHistory(f_ctrl)
 
         '''
         Function:
@@ -1015,7 +1338,6 @@ class SK_RT(omx.MPxCommand):
             x rotate correction (90/-90) for proper shape orientation
             move shape back, rotate it to align it parallel to back
             move pivot back to group
-            freezeDelHistory() to zero out transforms
         Vars:
             s_ctrl - shoulderblade controller
             s_rot_corr - x rotate correction (90/-90)
@@ -1025,21 +1347,18 @@ class SK_RT(omx.MPxCommand):
         '''
 
         def shoulder_ctrl_position(s_ctrl, s_rot_corr, rrev):
-            object_check(s_ctrl)
             ctrl_grp_prep("ik_", s_ctrl)
             pm.rotate(s_ctrl, s_rot_corr, 0, 0)
             pm.select((s_ctrl + "Shape"), replace=True)
             pm.move((rrev * 7), -7, -17, worldSpace=True, relative=True)
             pm.rotate((rrev * -7), 0, (rrev * -18.8), worldSpace=True, relative=True)
             pm.move((rrev * -7), 7, 17, s_ctrl + ".scalePivot", s_ctrl + ".rotatePivot", relative=True)
-            freezeDelHistory(s_ctrl)
 
         '''
         Function:
             knee and elbow controller position
             create, parent, position, orient group to PV locator
             rotate pyramid shape point towards elbow/knee
-            freezeDelHistory() to zero out transforms
         Vars:
             ke_ctrl - controller
             rotX_corr - rotate x correction (90,0)
@@ -1050,21 +1369,24 @@ class SK_RT(omx.MPxCommand):
 
         # kneel und spineB/C müssen jeweils mit locator und cluster verbunden werden
         def kneel_ctrl_position(ke_ctrl, rotX_corr, rotZ_corr):
-            object_check(ke_ctrl)
             ctrl_grp_prep("loc_", ke_ctrl)
             pm.rotate(ke_ctrl, rotX_corr, 0, rotZ_corr, relative=True)
-            freezeDelHistory(ke_ctrl)
 
         '''
         Function:
+            check all controller names that will be created with one ls call
             create "grp_controls" to parent controllers to it
             parent it to "grp_control_rig"
-            executing controller creation
-            executing grouping and positioning for controllers
+            first pass - executing controller creation, then recolor all of them
+            second pass - executing grouping and positioning for controllers
             rotate y to 0 on all spine and head groups, excluding neck
-            rotate z adjustment on neck controller to align it more with mesh-neck
-            freezeDelHistory() on neck controller
+            freezeDelHistory() on all positioned controllers at once
+            rotate z adjustment on neck controller to align it more with mesh-neck, frozen afterwards
         Vars:
+            ctrl_list - every controller created by the curve functions, checked with one ls call after creation
+            proto_names - every possible crv_proto prototype name, one per controller
+            ctrl_new - ctrl_list, their grp_null_ offset groups, prototypes and helper groups, checked before creation
+            ctrl_colors - colors queued by the curve functions
             null_grp - indices for controller groups
             names - indices for controller names
         Result:
@@ -1072,41 +1394,66 @@ class SK_RT(omx.MPxCommand):
         '''
 
         def nurbs_controller():
-            pm.parent(pm.group(name="grp_controls", empty=True), "grp_control_rig")
-            # curve creation
-            # basic / on joints
-            crv_root("ctrl_" + names[0])
-            crv_centerOfMass("ctrl_" + names[1])
-            crv_spineB("ctrl_" + names[2])
-            crv_spineC("ctrl_" + names[3])
-            crv_chest("ctrl_" + names[4])
-            crv_basic(("ctrl_" + names[5]), 10, 17)  # neck
-            crv_head("ctrl_" + names[6])
-            crv_hands("ctrl_" + names[15], 13)
-            crv_hands("ctrl_" + names[41], 6)
-            crv_fingers()
-
-            # different parent knee/elbow locator
-            crv_kneel("ctrl_PV_" + names[8], 13)
-            crv_kneel("ctrl_PV_" + names[34], 6)
-            crv_kneel("ctrl_PV_" + names[14], 13)
-            crv_kneel("ctrl_PV_" + names[40], 6)
-
-            # different parenting style clavicles/feet
-            crv_shoulder("ctrl_" + names[12], 13)
-            crv_shoulder("ctrl_" + names[38], 6)
-            crv_feet("ctrl_" + names[9], 13)
-            crv_feet("ctrl_" + names[35], 6)
+            ctrl_list = ([ctrl_names[n] for n in [0, 1, 2, 3, 4, 5, 6, 9, 12, 15, 35, 38, 41]]
+                         + ctrl_names[42:57] + ctrl_names[16:31]
+                         + ["ctrl_PV_" + names[n] for n in [8, 14, 34, 40]])
+            proto_names = ["proto_" + c for c in ctrl_list]
+            ctrl_new = (ctrl_list + ["grp_null_" + c for c in ctrl_list] + proto_names
+                        + ["grp_controls", "grp_crv_prototypes"])
+            bulk_non_object_check(ctrl_new)
+
+            grp_paths["controls"] = get_dag(cmds.createNode("transform", name="grp_controls", parent="grp_control_rig",
+                                                            skipSelect=True)).fullPathName()
+            try:
+                # curve creation
+                # basic / on joints
+                crv_root(ctrl_names[0])
+                crv_centerOfMass(ctrl_names[1])
+                crv_spineB(ctrl_names[2])
+                crv_spineC(ctrl_names[3])
+                crv_chest(ctrl_names[4])
+                crv_basic(ctrl_names[5], 10, 17)  # neck
+                crv_head(ctrl_names[6])
+                crv_hands(ctrl_names[15], 13)
+                crv_hands(ctrl_names[41], 6)
+                crv_fingers()
+
+                # different parent knee/elbow locator
+                crv_kneel("ctrl_PV_" + names[8], 13)
+                crv_kneel("ctrl_PV_" + names[34], 6)
+                crv_kneel("ctrl_PV_" + names[14], 13)
+                crv_kneel("ctrl_PV_" + names[40], 6)
+
+                # different parenting style clavicles/feet
+                crv_shoulder(ctrl_names[12], 13)
+                crv_shoulder(ctrl_names[38], 6)
+                crv_feet(ctrl_names[9], 13)
+                crv_feet(ctrl_names[35], 6)
+            finally:
+                # prototypes are not part of the rig, removed as well when the curve creation fails
+                if cmds.objExists("grp_crv_prototypes"):
+                    cmds.delete("grp_crv_prototypes")
+                proto_left = cmds.ls(proto_names)
+                if proto_left:
+                    cmds.delete(proto_left)
+                crv_protos.clear()
+
+            bulk_object_check(ctrl_list)
+
+            # recolor every controller once all curves exist
+            for (crv, col) in ctrl_colors:
+                recolor(crv, col)
+            ctrl_colors.clear()
 
             print("!!! Operation: Controller Creation successful.")
 
             # group positioning - fill null_grp
             basic_ctrl_position()
 
-            shoulder_ctrl_position("ctrl_" + names[12], 90, 1)
-            shoulder_ctrl_position("ctrl_" + names[38], -90, -1)
-            feet_ctrl_position("ctrl_" + names[9], 90, -90, 180)
-            feet_ctrl_position("ctrl_" + names[35], -90, -90, 0)
+            shoulder_ctrl_position(ctrl_names[12], 90, 1)
+            shoulder_ctrl_position(ctrl_names[38], -90, -1)
+            feet_ctrl_position(ctrl_names[9], 90, -90, 180)
+            feet_ctrl_position(ctrl_names[35], -90, -90, 0)
 
             kneel_ctrl_position("ctrl_PV_" + names[14], 90, 0)
             kneel_ctrl_position("ctrl_PV_" + names[40], 90, 0)
@@ -1115,14 +1462,14 @@ class SK_RT(omx.MPxCommand):
 
             # controller adjustments
             # center of mass ctrl muss auf rotate Y ausgenullt werden, damit es parallel zum Boden läuft
-            pm.rotate(null_grp[1], 0, rotateY=True, absolute=True)
-            pm.rotate(null_grp[2], 0, rotateY=True, absolute=True)
-            pm.rotate(null_grp[3], 0, rotateY=True, absolute=True)
-            pm.rotate(null_grp[4], 0, rotateY=True, absolute=True)
-            pm.rotate(null_grp[6], 0, rotateY=True, absolute=True)
+            for n in [1, 2, 3, 4, 6]:
+                cmds.setAttr(null_grp[n] + ".rotateY", 0)
+            # zero out all positioned controllers in one go
+            freezeDelHistory(basic_ctrl_grp + [ctrl_names[12], ctrl_names[38], ctrl_names[9], ctrl_names[35]]
+                             + ["ctrl_PV_" + names[n] for n in [14, 40, 8, 34]])
             # adjust neck controller to visually line up with neck
-            pm.rotate("ctrl_" + names[5], 12, rotateZ=True)
-            freezeDelHistory("ctrl_" + names[5])
+            pm.rotate(ctrl_names[5], 12, rotateZ=True)
+            freezeDelHistory([ctrl_names[5]])
 
             print("!!! Operation: Controller Positioning successful.")
 
@@ -1130,7 +1477,6 @@ class SK_RT(omx.MPxCommand):
         Function:
             orient, point and parent constrain joints, handles and controls to respective controlling parts
         Vars:
-            finger_names - combination of r_fingers and l_fingers
             full_ctrl_grp - indices for controller
         Result:
             functional controllers that can be moved individually
@@ -1143,63 +1489,43 @@ class SK_RT(omx.MPxCommand):
             pm.pointConstraint(full_ctrl_grp[45], "grp_null_PV_" + names[8])
             pm.pointConstraint(full_ctrl_grp[44], "grp_null_PV_" + names[40])
             pm.pointConstraint(full_ctrl_grp[43], "grp_null_PV_" + names[14])
-            pm.hide("grp_null_PV_" + names[34], "grp_null_PV_" + names[8], "grp_null_PV_" + names[40],
-                    "grp_null_PV_" + names[14])
+            cmds.hide("grp_null_PV_" + names[34], "grp_null_PV_" + names[8], "grp_null_PV_" + names[40],
+                      "grp_null_PV_" + names[14])
 
             # Arms
-            pm.pointConstraint(full_ctrl_grp[7], "hdl_" + names[15])
-            pm.pointConstraint(full_ctrl_grp[8], "hdl_" + names[41])
-            pm.orientConstraint(full_ctrl_grp[7], "ik_" + names[15])
-            pm.orientConstraint(full_ctrl_grp[8], "ik_" + names[41])
+            pm.pointConstraint(full_ctrl_grp[7], hdl_names[15])
+            pm.pointConstraint(full_ctrl_grp[8], hdl_names[41])
+            pm.orientConstraint(full_ctrl_grp[7], ik_names[15])
+            pm.orientConstraint(full_ctrl_grp[8], ik_names[41])
 
             # Root
-            pm.parentConstraint(full_ctrl_grp[0], "ik_" + names[0])
+            pm.parentConstraint(full_ctrl_grp[0], ik_names[0])
 
             # legs - heel
-            pm.parentConstraint(full_ctrl_grp[1], "ik_" + names[7], maintainOffset=True)
-            pm.parentConstraint(full_ctrl_grp[1], "ik_" + names[33], maintainOffset=True)
-            pm.parentConstraint(full_ctrl_grp[41], "grp_null_" + names[32], maintainOffset=True)
-            pm.parentConstraint(full_ctrl_grp[42], "grp_null_" + names[58], maintainOffset=True)
+            pm.parentConstraint(full_ctrl_grp[1], ik_names[7], maintainOffset=True)
+            pm.parentConstraint(full_ctrl_grp[1], ik_names[33], maintainOffset=True)
+            pm.parentConstraint(full_ctrl_grp[41], null_names[32], maintainOffset=True)
+            pm.parentConstraint(full_ctrl_grp[42], null_names[58], maintainOffset=True)
 
             # spine
             pm.parentConstraint(full_ctrl_grp[1], "ikh_" + names[1], maintainOffset=True)
-            pm.orientConstraint("ikh_" + names[1], "ik_" + names[1], maintainOffset=True)
+            pm.orientConstraint("ikh_" + names[1], ik_names[1], maintainOffset=True)
             pm.pointConstraint(full_ctrl_grp[2], "ikh_" + names[2], maintainOffset=True)
             pm.pointConstraint(full_ctrl_grp[3], "ikh_" + names[3], maintainOffset=True)
             pm.parentConstraint(full_ctrl_grp[4], "ikh_" + names[4], maintainOffset=True)
-            pm.orientConstraint(full_ctrl_grp[4], "ik_" + names[4], maintainOffset=True)
-            pm.orientConstraint(full_ctrl_grp[5], "ik_" + names[5], maintainOffset=True)
-            pm.orientConstraint(full_ctrl_grp[6], "ik_" + names[6], maintainOffset=True)
+            pm.orientConstraint(full_ctrl_grp[4], ik_names[4], maintainOffset=True)
+            pm.orientConstraint(full_ctrl_grp[5], ik_names[5], maintainOffset=True)
+            pm.orientConstraint(full_ctrl_grp[6], ik_names[6], maintainOffset=True)
 
             # shoulders
-            pm.orientConstraint(full_ctrl_grp[39], "ik_" + names[12], maintainOffset=True)
-            pm.orientConstraint(full_ctrl_grp[40], "ik_" + names[38], maintainOffset=True)
+            pm.orientConstraint(full_ctrl_grp[39], ik_names[12], maintainOffset=True)
+            pm.orientConstraint(full_ctrl_grp[40], ik_names[38], maintainOffset=True)
 
-            finger_names = l_fingers + r_fingers
-            for fn in finger_names:
-                pm.orientConstraint("ctrl_" + fn, "ik_" + fn)
+            for n in list(range(16, 31)) + list(range(42, 57)):
+                pm.orientConstraint(ctrl_names[n], ik_names[n])
 
             print("!!! Operation: Controller Functionality successful.")
 
-        '''
-        Function:
-            iterate through finger_array to divide it into triplets
-            append triplets to single_fingers
-        Vars:
-            finger_array - r_fingers / l_fingers
-            single_fingers - array for separate finger lists
-        Result:
-            2D array with separate finger lists for controller group parenting
-        '''
-
-        def finger_triplets(finger_array):
-            single_fingers = []
-            # get finger triplets
-            for sf in range(0, len(finger_array), 3):
-                single = finger_array[sf:sf + 3]
-                single_fingers.append(single)
-            return single_fingers
-
         '''
         Function:
             parenting ctrl groups to ctrls into a hierarchy for compound movement
@@ -1210,63 +1536,72 @@ class SK_RT(omx.MPxCommand):
             l_hand ctrl - grps: l_thumb_a, l_pointer_a, l_middle_a, l_ring_a, l_pinkie_a
             r_hand ctrl - grps: r_thumb_a, r_pointer_a, r_middle_a, r_ring_a, r_pinkie_a
 
-            2D arrays for compound finger ctrls and grps
-            parent current element of grps to previous element of ctrls to create hierarchy
+            step through finger grps and ctrls in triplets (a, b, c per finger)
+            parent b grp to a ctrl and c grp to b ctrl to create hierarchy
+            all parenting is collected and done in one reparent_batch()
         Vars:
-            all_finger_grps - 
-            all_finger_ctrls
+            ctrl_top - controller name unwrapped from every full_ctrl_grp entry, parent targets
+            hierarchy_pairs - (grp, ctrl) pairs of the whole controller hierarchy
         Result:
             compound usable controller hierarchy, which moves in relation to another
         '''
 
         def ctrl_hierarchy():
+            ctrl_top = [c[0] for c in full_ctrl_grp]
             # parenting controls together
             # spine / torso
-            pm.parent(null_grp[2], full_ctrl_grp[1])
-            pm.parent(null_grp[7:9], null_grp[41:43], null_grp[1], null_grp[4], null_grp[45:47], null_grp[43:45],
-                      full_ctrl_grp[0])
-            pm.parent(null_grp[39:41], null_grp[3], null_grp[5], full_ctrl_grp[4])
-            pm.parent(null_grp[6], full_ctrl_grp[5])
+            hierarchy_pairs = [(null_grp[2], ctrl_top[1])]
+            hierarchy_pairs += [(null_grp[g], ctrl_top[0]) for g in [7, 8, 41, 42, 1, 4, 45, 46, 43, 44]]
+            hierarchy_pairs += [(null_grp[g], ctrl_top[4]) for g in [39, 40, 3, 5]]
+            hierarchy_pairs.append((null_grp[6], ctrl_top[5]))
             # hands
-            pm.parent(null_grp[24], null_grp[27], null_grp[30], null_grp[33], null_grp[36], full_ctrl_grp[7])
-            pm.parent(null_grp[9], null_grp[12], null_grp[15], null_grp[18], null_grp[21], full_ctrl_grp[8])
-
-            # arrays for finger grps and ctrls
-            all_finger_grps = null_grp[9:24] + null_grp[24:39]
-            all_finger_ctrls = full_ctrl_grp[9:24] + full_ctrl_grp[24:39]
+            hierarchy_pairs += [(null_grp[g], ctrl_top[7]) for g in [24, 27, 30, 33, 36]]
+            hierarchy_pairs += [(null_grp[g], ctrl_top[8]) for g in [9, 12, 15, 18, 21]]
 
-            # similar to parenting(), arrays of fingers in one
-            finger_grps = finger_triplets(all_finger_grps)
-            finger_ctrls = finger_triplets(all_finger_ctrls)
-            # iterate through both arrays, use 1. as reference point
+            # fingers grps and ctrls 9 - 38, similar to parenting(), one finger triplet at a time
             # parent current element of grps to previous element of ctrls
-            for (f_grp, f_ctrl) in zip(finger_grps, finger_ctrls):
-                finger_len = len(f_grp)
-                for fp in range(1, finger_len):
-                    pm.parent(f_grp[fp], f_ctrl[fp - 1])
+            for f in range(9, 39, 3):
+                hierarchy_pairs += [(null_grp[f + 1], ctrl_top[f]), (null_grp[f + 2], ctrl_top[f + 1])]
+
+            reparent_batch(hierarchy_pairs)
 
             print("!!! Operation: Controller Hierarchy successful.")
 
         '''
         Function:
-            add toe, ball, heel float attributes to foot with max and min values
+            add toe, ball, heel float attributes to both feet with max and min values
             connect custom attributes to respective rotate x attributes of reverse rig locator
+            attributes and connections of both feet are queued in one MDGModifier
+        Vars:
+            foot_sides - (foot controller, side) pairs
+            foot_attrs - long name, short name, min and max value of each foot attribute
+            foot_plugs - foot node, new attribute and reverse rig locator rotateX plug name to connect
         Result:
             toe, ball, heel attributes for foot roll possibility on foot
         '''
 
-        def addFeetAttr(foot_ctrl, side):
-            object_check(foot_ctrl)
-            pm.addAttr(foot_ctrl, shortName="tip", longName="Tip", defaultValue=0, minValue=0, maxValue=160,
-                       keyable=True)
-            pm.addAttr(foot_ctrl, shortName="ball", longName="Ball", defaultValue=0, minValue=0, maxValue=70,
-                       keyable=True)
-            pm.addAttr(foot_ctrl, shortName="heel", longName="Heel", defaultValue=0, minValue=-90, maxValue=50,
-                       keyable=True)
-
-            pm.connectAttr(foot_ctrl + ".tip", "ik_loc_" + side + "_tip.rotateX")
-            pm.connectAttr(foot_ctrl + ".ball", "ik_loc_" + side + "_ball.rotateX")
-            pm.connectAttr(foot_ctrl + ".heel", "ik_loc_" + side + "_heel.rotateX")
+        def addFeetAttr(foot_sides):
+            bulk_object_check([foot_ctrl for (foot_ctrl, side) in foot_sides])
+            foot_attrs = [("Tip", "tip", 0, 160), ("Ball", "ball", 0, 70), ("Heel", "heel", -90, 50)]
+
+            dg_mod = om.MDGModifier()
+            attr_fn = om.MFnNumericAttribute()
+            foot_plugs = []
+            for (foot_ctrl, side) in foot_sides:
+                foot_node = get_dag(foot_ctrl).node()
+                for (long_n, short_n, min_v, max_v) in foot_attrs:
+                    attr_obj = attr_fn.create(long_n, short_n, om.MFnNumericData.kDouble, 0)
+                    attr_fn.setMin(min_v)
+                    attr_fn.setMax(max_v)
+                    attr_fn.setKeyable(True)
+                    dg_mod.addAttribute(foot_node, attr_obj)
+                    foot_plugs.append((foot_node, attr_obj, "ik_loc_" + side + "_" + short_n + ".rotateX"))
+            dg_mod.doIt()
+
+            # plugs of the new attributes exist after the first doIt(), same modifier only runs the connections
+            for (foot_node, attr_obj, rot_plug) in foot_plugs:
+                dg_mod.connect(om.MPlug(foot_node, attr_obj), get_plug(rot_plug))
+            dg_mod.doIt()
 
             print("!!! Operation: Foot Attribute Setup successful.")
 
@@ -1290,129 +1625,113 @@ class SK_RT(omx.MPxCommand):
             add feet attributes
             lock groups and controller attributes through controller array
             > lock: all ctrls scale, FK translate, PV + spine b/c rotate
+            the whole build runs inside fast_build()
         Vars:
             spine_jnts - array of IK handle joints (ikh) to bind to IK spline
+            lock_spec - translate/rotate/scale lock per full_ctrl_grp index, scale only if not listed
         Result: 
             ready to use control rig
         '''
 
         def ctrl_creation(*args):
-            # create ik control rig
-            pm.currentUnit(linear="cm")
+            with fast_build():
+                # create ik control rig
+                unit_check()
 
-            # reset arrays
-            ik_jnts_check.clear()
-            basic_ctrl_grp.clear()
-            null_grp.clear()
-            full_ctrl_grp.clear()
+                # reset arrays
+                clear_arrays(ctrl_arrays)
 
-            create_control_rig()
+                create_control_rig()
 
-            # individual ik solver for limbs
-            create_ik(ik_jnts_check[47], "rp")
-            create_ik(ik_jnts_check[48], "sc")
-            create_ik(ik_jnts_check[49], "sc")
+                # ikSplineHandle - auto-create curve (default), adjusted twist Type for more realistic movement
+                # created before the limb handles, so its curve fit runs before their solvers dirty the ik skeleton
+                spine_ik = cmds.ikHandle(name="hdl_c_spine", solver="ikSplineSolver", twistType="easeIn",
+                                         startJoint=ik_jnts_check[1], endEffector=ik_jnts_check[4])
 
-            create_ik(ik_jnts_check[52], "rp")
-            create_ik(ik_jnts_check[53], "sc")
-            create_ik(ik_jnts_check[54], "sc")
+                # rename the returned curve, parent curve and handle to grp_rig_system
+                spine_crv = cmds.rename(spine_ik[2], "crv_c_spine")
+                cmds.parent(spine_crv, spine_ik[0], grp_paths["rig_system"])
 
-            create_ik(ik_jnts_check[10], "rp")
-            create_ik(ik_jnts_check[29], "rp")
+                # individual ik solver for limbs
+                create_ik(ik_jnts_check[47], "rp")
+                create_ik(ik_jnts_check[48], "sc")
+                create_ik(ik_jnts_check[49], "sc")
 
-            # PVs for arms/legs
-            setupPV(ik_jnts_check[9], "hdl_" + names[15], [0, 0, 35])
-            setupPV(ik_jnts_check[28], "hdl_" + names[41], [0, 0, 35])
-            setupPV(ik_jnts_check[46], "hdl_" + names[9], [0, 35, 0])
-            setupPV(ik_jnts_check[51], "hdl_" + names[35], [0, -35, 0])
+                create_ik(ik_jnts_check[52], "rp")
+                create_ik(ik_jnts_check[53], "sc")
+                create_ik(ik_jnts_check[54], "sc")
 
-            print("!!! Operation: IK Limb Setup successful.")
+                create_ik(ik_jnts_check[10], "rp")
+                create_ik(ik_jnts_check[29], "rp")
 
-            connect_rig()
+                # PVs for arms/legs
+                setupPV(ik_jnts_check[9], hdl_names[15], [0, 0, 35])
+                setupPV(ik_jnts_check[28], hdl_names[41], [0, 0, 35])
+                setupPV(ik_jnts_check[46], hdl_names[9], [0, 35, 0])
+                setupPV(ik_jnts_check[51], hdl_names[35], [0, -35, 0])
 
-            # ikSplineHandle - auto-create curve (default), adjusted twist Type for more realistic movement
-            pm.ikHandle(name="hdl_c_spine", solver="ikSplineSolver", twistType="easeIn",
-                        startJoint=ik_jnts_check[1], endEffector=ik_jnts_check[4])
+                print("!!! Operation: IK Limb Setup successful.")
 
-            # rename curve, parent curve and handle to grp_rig_system
-            spine_crv = pm.listRelatives(ik_jnts_check[0], allDescendents=True)[-1]
-            pm.rename(spine_crv, "crv_c_spine")
-            pm.parent(spine_crv, "hdl_c_spine", "grp_rig_system")
+                connect_rig()
 
-            # create, position ikh joints and bind spline to it
-            spine_jnts = ["ikh_c_hips", "ikh_c_spine_b", "ikh_c_spine_c", "ikh_c_chest"]
+                # create ikh joints directly inside grp_rig_system, position them and bind spline to it
+                spine_jnts = ["ikh_c_hips", "ikh_c_spine_b", "ikh_c_spine_c", "ikh_c_chest"]
 
-            for spine_jnt in spine_jnts:
-                non_object_check(spine_jnt)
-                pm.select(clear=True)
-                pm.joint(name=spine_jnt)
+                bulk_non_object_check(spine_jnts)
+                for spine_jnt in spine_jnts:
+                    cmds.createNode("joint", name=spine_jnt, parent=grp_paths["rig_system"], skipSelect=True)
 
-            pm.delete(pm.parentConstraint(ik_jnts_check[1], spine_jnts[0]))
-            pm.delete(pm.parentConstraint(ik_jnts_check[2], spine_jnts[1]))
-            pm.delete(pm.parentConstraint(ik_jnts_check[3], spine_jnts[2]))
-            pm.delete(pm.parentConstraint(ik_jnts_check[4], spine_jnts[3]))
-            pm.skinCluster(spine_jnts[0], spine_jnts[1], spine_jnts[2], spine_jnts[3], "crv_c_spine",
-                           maximumInfluences=3)
+                for (spine_jnt, ik_j) in zip(spine_jnts, ik_jnts_check[1:5]):
+                    snap(spine_jnt, ik_j)
+                cmds.skinCluster(spine_jnts[0], spine_jnts[1], spine_jnts[2], spine_jnts[3], "crv_c_spine",
+                                 maximumInfluences=3)
 
-            pm.parent(spine_jnts[0:4], "grp_rig_system")
+                # when root ctrl gets added, spine would move with root and inheritance (meaning x2 transformation)
+                # Setup Advanced Twist Controls to give ability to rotate spine around itself
+                cmds.setAttr("hdl_c_spine.inheritsTransform", 0)
+                cmds.setAttr("hdl_c_spine.dTwistControlEnable", 1)
+                cmds.setAttr("hdl_c_spine.dWorldUpType", 4)  # objectRotationUp(start/end)
+                cmds.setAttr("hdl_c_spine.dForwardAxis", 0)  # +x
+                cmds.setAttr("hdl_c_spine.dWorldUpAxis", 0)  # +y - goes for base (hip) joint
 
-            # when root ctrl gets added, spine would move with root and inheritance (meaning x2 transformation)
-            # Setup Advanced Twist Controls to give ability to rotate spine around itself
-            ikc = pm.PyNode("hdl_c_spine")
-            ikc.inheritsTransform.set(0)
-            ikc.dTwistControlEnable.set(1)
-            ikc.dWorldUpType.set(4)  # objectRotationUp(start/end)
-            ikc.dForwardAxis.set(0)  # +x
-            ikc.dWorldUpAxis.set(0)  # +y - goes for base (hip) joint
+                # can't connect through variable, needs to be called by string
+                cmds.connectAttr("ikh_c_hips.worldMatrix[0]", "hdl_c_spine.dWorldUpMatrix", force=True)
+                cmds.connectAttr("ikh_c_chest.worldMatrix[0]", "hdl_c_spine.dWorldUpMatrixEnd", force=True)
 
-            # can't connect through variable, needs to be called by string
-            pm.connectAttr("ikh_c_hips.worldMatrix[0]", "hdl_c_spine.dWorldUpMatrix", force=True)
-            pm.connectAttr("ikh_c_chest.worldMatrix[0]", "hdl_c_spine.dWorldUpMatrixEnd", force=True)
+                print("!!! Operation: IK Spine Setup successful.")
 
-            print("!!! Operation: IK Spine Setup successful.")
+                reverseFoot()
 
-            reverseFoot()
+                lock_attr([grp_paths["rig_system"]], [1, 1, 1], 1)
 
-            lock_attr("grp_rig_system", [1, 1, 1], 1, 1)
+                # create visual controls
+                nurbs_controller()
 
-            # create visual controls
-            nurbs_controller()
+                # create array for ctrls
+                for ngc in null_grp:
+                    full_ctrl_grp.append(cmds.listRelatives(ngc, children=True))
 
-            # create array for ctrls
-            for ngc in null_grp:
-                full_ctrl_grp.append(ngc.getChildren())
+                ctrl_functionality()
 
-            ctrl_functionality()
+                ctrl_hierarchy()
 
-            ctrl_hierarchy()
+                addFeetAttr([("ctrl_l_foot", "l"), ("ctrl_r_foot", "r")])
 
-            addFeetAttr("ctrl_l_foot", "l")
-            addFeetAttr("ctrl_r_foot", "r")
+                cmds.hide("grp_ik_rig", grp_paths["rig_system"])
 
-            pm.hide("grp_ik_rig", "grp_rig_system")
+                # lock groups and controls, all of them are freshly created and keyable
+                # groups
+                lock_attr(null_grp, [1, 1, 1], 1)
 
-            # lock groups and controls
-            # groups
-            for null_l in null_grp:
-                lock_attr(null_l, [1, 1, 1], 1, 1)
+                # controls in one pass - all scale, FK also translate, PV und Spine also rotate
+                lock_spec = {i: [1, 0, 1] for i in list(range(5, 7)) + list(range(9, 41))}
+                lock_spec.update({i: [0, 1, 1] for i in list(range(43, 47)) + list(range(2, 4))})
+                for (i, ctrl_l) in enumerate(full_ctrl_grp):
+                    lock_attr(ctrl_l, lock_spec.get(i, [0, 0, 1]), 1)
 
-            # all controls scale
-            for ctrl_l in full_ctrl_grp:
-                for clock in ctrl_l:
-                    lock_attr(clock, [0, 0, 1], 1, 1)
-            # FK
-            for rot_ctrl_l in full_ctrl_grp[5:7] + full_ctrl_grp[9:41]:
-                for rclock in rot_ctrl_l:
-                    lock_attr(rclock, [1, 0, 1], 1, 1)
+                print("!!! Operation: Controller Lock successful.")
 
-            # PV und Spine
-            for pos_ctrl_l in full_ctrl_grp[43:47] + full_ctrl_grp[2:4]:
-                for pclock in pos_ctrl_l:
-                    lock_attr(pclock, [0, 1, 1], 1, 1)
-
-            print("!!! Operation: Controller Lock successful.")
-
-            pm.select(clear=True)
+                cmds.select(clear=True)
 
         '''
         Function:
@@ -1424,21 +1743,17 @@ class SK_RT(omx.MPxCommand):
 
         def reset_locs(*args):
             # wipe all global lists since joint creation
-            jnts.clear()
-            basic_ctrl_grp.clear()
-            null_grp.clear()
-            full_ctrl_grp.clear()
+            clear_arrays(jnt_arrays, ctrl_arrays)
 
             # enable locator buttons
             pm.button("b_l_mirror", edit=True, enable=True)
             pm.button("b_r_mirror", edit=True, enable=True)
 
-            # delete joint and control groups
-            pm.showHidden("grp_loc_rig")
-            if pm.objExists("grp_bind_rig"):
-                pm.delete("grp_bind_rig")
-            if pm.objExists("grp_control_rig"):
-                pm.delete("grp_control_rig")
+            # delete joint and control groups, one ls call finds whichever of them exist
+            cmds.showHidden("grp_loc_rig")
+            old_grps = cmds.ls("grp_bind_rig", "grp_control_rig")
+            if old_grps:
+                cmds.delete(old_grps)
 
             print("!!! Operation: Reset to Locator successful.")
 
@@ -1451,34 +1766,36 @@ class SK_RT(omx.MPxCommand):
         '''
 
         def reset_jnts(*args):
-            # wipe all global lists since joint creation
-            basic_ctrl_grp.clear()
-            null_grp.clear()
-            full_ctrl_grp.clear()
+            # wipe all global lists since control creation
+            clear_arrays(ctrl_arrays)
 
             # delete joint and control groups
-            pm.showHidden("grp_bind_rig")
-            if pm.objExists("grp_control_rig"):
-                pm.delete("grp_control_rig")
-
-            # zero out joints aferwards
-            jnt_names = names[0:31] + names[33:57]
-            for zero_jnt in jnt_names:
-                pm.xform("jnt_" + zero_jnt, objectSpace=True, rotation=[0, 0, 0])
-            pm.xform("jnt_" + names[0], translation=og_root_pos[0], absolute=True)
-            pm.xform("jnt_" + names[1], translation=og_root_pos[1], absolute=True)
+            cmds.showHidden("grp_bind_rig")
+            if cmds.objExists("grp_control_rig"):
+                cmds.delete("grp_control_rig")
+
+            # zero out joints aferwards, one compound setAttr per joint
+            for zero_jnt in jnt_names[0:31] + jnt_names[33:57]:
+                cmds.setAttr(zero_jnt + ".rotate", 0, 0, 0, type="double3")
+            cmds.setAttr(jnt_names[0] + ".translate", *og_root_pos[0], type="double3")
+            cmds.setAttr(jnt_names[1] + ".translate", *og_root_pos[1], type="double3")
             print("!!! Operation: Reset to Skeleton successful.")
 
         '''
         Function:
-            select all visible objects in viewport
-            toggle local rotation axis
+            list all visible transforms below the rig groups, the rest of the scene is left out
+            toggle local rotation axis on them, the selection stays untouched
+        Vars:
+            rig_grps - existing locator, bind and control rig groups
+            rig_nodes - visible transforms and joints inside rig_grps
         '''
 
         def toggleTransforms(*args):
-            pm.select(all=True, hierarchy=True, visible=True)
-            pm.toggle(localAxis=True)
-            pm.select(clear=True)
+            rig_grps = cmds.ls("grp_loc_rig", "grp_bind_rig", "grp_control_rig")
+            # ls without objects would list the whole scene
+            rig_nodes = cmds.ls(rig_grps, dag=True, visible=True, type="transform") if rig_grps else []
+            if rig_nodes:
+                cmds.toggle(rig_nodes, localAxis=True)
 
         '''
         Transfer Vars:
@@ -1492,34 +1809,26 @@ class SK_RT(omx.MPxCommand):
         Function: 
             see, if texts are correlating to an object in the scene with the same name, otherwise invalidate input
             if input valid, skin the correlating mesh to the correlating joint hierarchy
+            both objects are passed to skinCluster directly, the selection stays untouched
         Result: 
             skinCluster on root bone and Mesh
         '''
 
         def skinning(bone, mesh, *args):
-            sR = pm.textField(bone, query=True, text=True)
-            sM = pm.textField(mesh, query=True, text=True)
-            check_sR = True
-            check_sM = True
-            try:
-                pm.select(sR, replace=True)
-            except TypeError:
+            sR = cmds.textField(bone, query=True, text=True)
+            sM = cmds.textField(mesh, query=True, text=True)
+            check_sR = bool(sR) and cmds.objExists(sR)
+            check_sM = bool(sM) and cmds.objExists(sM)
+            if not check_sR:
                 print(f"!!! TYPE ERROR: Transform '{sR}' does not exist")
-                pm.select(clear=True)
-                check_sR = False
-
-            try:
-                pm.select(sM, add=True)
-            except TypeError:
+            if not check_sM:
                 print(f"!!! TYPE ERROR: Geometry '{sM}' does not exist")
-                pm.select(clear=True)
-                check_sM = False
 
             if check_sR and check_sM:
                 try:
-                    pm.skinCluster(bindMethod=1, skinMethod=1, normalizeWeights=1, weightDistribution=1,
-                                   maximumInfluences=5, obeyMaxInfluences=True, dropoffRate=4,
-                                   removeUnusedInfluence=True)
+                    cmds.skinCluster(sR, sM, bindMethod=1, skinMethod=1, normalizeWeights=1, weightDistribution=1,
+                                     maximumInfluences=5, obeyMaxInfluences=True, dropoffRate=4,
+                                     removeUnusedInfluence=True)
                     print(f"!!! OPERATION: Objects '{sR}' and '{sM}' were successfully connected through a skinCluster")
                 except RuntimeError:
                     print(f"!!! RUNTIME ERROR: Geometry '{sM}' is already connected to a skinCluster")
@@ -1538,18 +1847,32 @@ class SK_RT(omx.MPxCommand):
 
         # Transfer Variable: b_mesh - bound Mesh to be unbound
         def unbindSkin(b_mesh, *args):
-            bM = pm.textField(b_mesh, query=True, text=True)
+            bM = cmds.textField(b_mesh, query=True, text=True)
+            if not (bM and cmds.objExists(bM)):
+                print(f"!!! TYPE ERROR: Geometry '{bM}' does not exist")
+                return
             try:
-                pm.select(bM, replace=True)
-                pm.skinCluster(edit=True, unbind=True)
+                cmds.skinCluster(bM, edit=True, unbind=True)
                 print(f"!!! OPERATION: SkinCluster from geometry '{bM}' was removed successfully")
-            except TypeError:
-                pm.select(clear=True)
-                print(f"!!! TYPE ERROR: Geometry '{bM}' does not exist")
             except RuntimeError:
-                pm.select(clear=True)
                 print(f"!!! RUNTIME ERROR: Geometry '{bM}' is not connected to a skinCluster")
 
+        '''
+        Function:
+            delete an already open window of that name, then create it anew
+        Vars:
+            win_name - window object name
+            win_title - window title
+            win_flags - further cmds.window flags
+        Result:
+            name of the fresh window
+        '''
+
+        def fresh_window(win_name, win_title, **win_flags):
+            if cmds.window(win_name, exists=True):
+                cmds.deleteUI(win_name)
+            return cmds.window(win_name, title=win_title, **win_flags)
+
         '''
         Function:
             "About" window
@@ -1563,32 +1886,15 @@ class SK_RT(omx.MPxCommand):
 
         def aboutUI(*args):
             print("--------------------------")
-            if cmds.window("sk_about", exists=True):
-                cmds.deleteUI("sk_about")
-            about_win = cmds.window("sk_about", title="Function Help")
+            about_win = fresh_window("sk_about", "Function Help")
 
             cmds.columnLayout(adjustableColumn=True, columnAlign="left", columnAttach=["both", 7], enable=True,
                               columnOffset=["left", 20])
 
-            cmds.separator(style="none", height=15)
-
-            cmds.text(
-                label="This plug-in tool is designed to help rig a bipedal creature for\ngame animation purposes inside Autedesk Maya 2023+. It operates\nwith PyMel and the Maya Python API 1.0.")
-            cmds.separator(style="none", height=12)
-            cmds.text(
-                label="This program was built within a bachelors project. As this plug-in\nhandles itself as a custom script for Autodesk Maya, it is marked\nas free softwar: You can redistribute and/or modify it.")
-            cmds.text(
-                label="This program is distributed in the hope that it will be useful,\nbut without any warranty.")
-
-            cmds.separator(style="none", height=12)
-            cmds.text(label="Author: Suzanne Knoop")
-            cmds.text(label="E-Mail: suzanne.tamara@gmail.com")
-            cmds.text(label="Last Update: 01/29/2024")
-            cmds.text(label="Version: 0.0.2")
-            cmds.separator(style="none", height=15)
-
-            cmds.text(label="Known Issues:", font="boldLabelFont")
-            cmds.text(label="* 'Reset to Skeleton' doesn't reset the hip translation attributes\n   after restart")
+            for (sep_h, about_lines) in about_texts:
+                cmds.separator(style="none", height=sep_h)
+                for (about_label, about_font) in about_lines:
+                    cmds.text(label=about_label, font=about_font)
             cmds.separator(style="none", height=17)
 
             cmds.showWindow(about_win)
@@ -1604,68 +1910,18 @@ class SK_RT(omx.MPxCommand):
 
         def helpUI(*args):
             print("--------------------------")
-            if cmds.window("sk_help", exists=True):
-                cmds.deleteUI("sk_help")
-            help_win = cmds.window("sk_help", title="Function Help")
+            help_win = fresh_window("sk_help", "Function Help")
 
             cmds.columnLayout(adjustableColumn=True, columnAlign="left", columnAttach=["both", 5], enable=True,
                               columnOffset=["left", 20])
             # header
             cmds.separator(style="none", height=5)
             cmds.text(label="Functions Rundown", font="boldLabelFont", height=20)
-            # locators
-            pm.separator(style="in", height=10)
-            cmds.text(label="Pose Dropdown Menu:", font="boldLabelFont")
-            pose_txt = cmds.text(
-                label="Preset for the to be created locators.\nA-Pose is adjusted to the UE5 Male Mannequin.")
-            pm.separator(style="none", height=10)
-            cmds.text(label="Hierarchy Dropdown Menu:", font="boldLabelFont")
-            hierarchy_txt = cmds.text(
-                label="Acts as preset and interactive function.\n'Locators in Hierarchy' puts locators in hierachial order.\n'Locators Solo' sets locators as unrelated objects.")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Create Locators Button:", font="boldLabelFont")
-            loc_txt = cmds.text(
-                label="Creates Locators with given presets.\nLocators follow a bipedal structure.\nThe structure is aimed to be optimized for game development.")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Mirror Buttons:", font="boldLabelFont")
-            miror_txt = cmds.text(
-                label="Mirrors locator translation and rotation to the other side.\nEvery locator from one side will be mirrored to the other.\nThey can be mirrored from left and right, respectively.")
-            # middle part
-            pm.separator(style="single", height=15)
-            cmds.text(label="Create Skeleton Button:", font="boldLabelFont")
-            skel_txt = cmds.text(
-                label="Creates a joint hierarchy based on the preexisting locator positions.\n* Basic XYZ orientations with mostly mirrored behaviour\n* Thumb X rotations usually need to be adjusted")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Create IK Controls Button:", font="boldLabelFont")
-            ctrls_txt = cmds.text(
-                label="Creates a separate, to be manipuleted IK joint skeleton.\nCreates respective spine, arm and leg IK controller.\n* Additional FK controls for neck, head and fingers\n* Tip, ball and heel attributes for foot controls\n* Advanced twist controls, adjust if spine is twisted")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Local Rotation Axes Toggle:", font="boldLabelFont")
-            lra_txt = cmds.text(label="Toggles the Local Rotation Axes display on all visible objects.")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Reset to Locators Button:", font="boldLabelFont")
-            reset_loc_txt = cmds.text(
-                label="Deletes everything the tool created, except the locator group.\n*Locator positions won't reset.")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Reset to Skeleton Button:", font="boldLabelFont")
-            reset_loc_txt = cmds.text(
-                label="Deletes the controls unter grp_control_rig, returning to the base skeleton.\n*Any animations and controller movements will be reversed.")
-            # skinning
-            cmds.separator(style="single", height=10)
-            cmds.separator(style="single", height=10)
-            cmds.text(label="Root Bone Textfield:", font="boldLabelFont")
-            root_txt = cmds.text(label="Field to write the name of the first joint of the to be bound hierarchy.")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Mesh Textfield:", font="boldLabelFont")
-            mesh_txt = cmds.text(label="Field to write the name of the to be skinned mesh.")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Bind Skin Button:", font="boldLabelFont")
-            skin_txt = cmds.text(
-                label="Skin mesh to hierarchy from the texfields.\n*Bind Method - Closest in Hierarchy\n*Skinning Method - Dual-Quaternion\n*Max Influences - 5")
-            cmds.separator(style="none", height=10)
-            cmds.text(label="Unbind Skin Button:", font="boldLabelFont")
-            unbind_txt = cmds.text(
-                label="Deletes the skinCluster of the written mesh.\n*Also deletes the skin wheights.")
+            for (help_seps, help_header, help_body) in help_texts:
+                for (sep_style, sep_h) in help_seps:
+                    cmds.separator(style=sep_style, height=sep_h)
+                cmds.text(label=help_header, font="boldLabelFont")
+                cmds.text(label=help_body, font="plainLabelFont")
             cmds.separator(style="none", height=10)
 
             cmds.showWindow(help_win)
@@ -1677,110 +1933,121 @@ class SK_RT(omx.MPxCommand):
         Vars: 
             sk_win - GUI window
             sk_art - SuzanneKnoop_Auto_Rigging_Toolkit
-            skinRoot - to be selected joint hierarchy from text
-            skinMesh - to be selected mesh from text
+            ui_widgets - widget kind to cmds widget command
+            ui_rows - (widget kind, name, flags) per GUI element, created in one pass
+            tf_skinRoot - text field, to be selected joint hierarchy from text
+            tf_skinMesh - text field, to be selected mesh from text
         Result:
             create functional GUI upon execution
         '''
 
         def artUI():
             print("--------------------------")
-            if cmds.window("sk_art", exists=True):
-                cmds.deleteUI("sk_art")
-            sk_win = cmds.window("sk_art", title="Bipedal Rigging Tool", menuBar=True)
-            pm.rowColumnLayout(numberOfColumns=2, columnSpacing=[(1, 1), (2, 7)],
-                               columnOffset=[(1, "both", 22), (2, "left", 22)], columnWidth=[(1, 100), (2, 200)],
-                               rowSpacing=(1, 22), columnAlign=[(1, "left"), (2, "left")])
-
-            # help menu
-            pm.menu("help_menu", label="Help", helpMenu=True, enable=True)
-            pm.menuItem("about_item", label="About", command=aboutUI)
-            pm.menuItem("func_item", label="Function Overview", command=helpUI)
-
-            # Locator section
-            pm.text(label="    < 1. Locator >    ", enable=True, width=200)
-            pm.separator(style="single", height=2, width=160)
-
-            # pose and hierarchy
-            pm.optionMenu("pose_option", backgroundColor=[0.22, 0.22, 0.22], width=100, height=23)
-            pm.menuItem(label="A-Pose")
-            pm.menuItem(label="T-Pose")
-
-            pm.optionMenu("hierarchy_option", changeCommand=loc_solo_hierarchy_button, width=157, height=23)
-            pm.menuItem(label="Move as Hierarchy")
-            pm.menuItem(label="Move as Solo")
-
-            # locators
-            pm.button("bt_locs", label="Create Locators", width=100, height=30, enable=True,
-                      command=partial(create_locator_hierarchy), backgroundColor=[0.45, 0.45, 0.45],
-                      annotation="Create a Locator Hierarchy which can be customized upon creation, to fit the desired skeletal Proportion")
-            pm.text(label=" Place where your joints are", enable=False)
-
-            # mirror
-            cmds.button("b_l_mirror", label="Mirror L > R", width=100, height=30, enable=True,
-                        command=partial(loc_mirror, "l"))
-            cmds.button("b_r_mirror", label="Mirror R > L", width=103, height=30, enable=True,
-                        command=partial(loc_mirror, "r"))
-
-            # Skeleton section
-            pm.text(label="    < 2. Skeleton >    ", enable=True, width=200)
-            pm.separator(style="single", height=1, width=160)
-
-            # skeleton
-            pm.button("bt_bones", label="Create Skeleton", width=100, height=30, enable=True,
-                      command=create_joint_hierarchy, backgroundColor=[0.45, 0.45, 0.45],
-                      annotation="Create a Joint Hierarchy according to the Locator Positions with basic XYZ Joint Orientations, WITHOUT single corrections")
-            pm.text(label=" Check orientations afterwards", enable=False)
-
-            # controls
-            pm.button("bt_ctrls", label="Create IK Controls", enable=True, command=ctrl_creation, width=100,
-                      height=30, backgroundColor=[0.45, 0.45, 0.45],
-                      annotation="Create IK Controls for Arms/Fingers, Legs/Feet, Head and Spine (IK Spline)")
-            pm.separator(style="none", height=2)
-
-            # toggle
-            pm.checkBox(label=" Toggle Local Rotation Axes", changeCommand=toggleTransforms, width=200,
-                        annotation="Toggles the 'Display Local Rotation Axes'-control on all visible objects")
-            pm.text(label="")
-
-            # resets
-            pm.button("bt_resetLocs", label="Reset to Locators", enable=True, command=reset_locs, width=100, height=30,
-                      backgroundColor=[0.4, 0.3, 0.3],
-                      annotation="Deletes everything the tool created, except the Locator Hierarchy to make further placement adjustments")
-            pm.text(label="Delete Joint Hierarchy", enable=False)
-
-            pm.button("bt_resetJnts", label="Reset to Skeleton", enable=True, command=reset_jnts, width=100, height=30,
-                      backgroundColor=[0.4, 0.3, 0.3],
-                      annotation="Deletes the Control Rig to make furthere adjustments to the base skeleton")
-            pm.text(label="Delete Control Rig", enable=False)
-
-            pm.separator(style="none", height=1)
-            pm.separator(style="none", height=1)
-
-            # Skinning
-            pm.text(label="    < Skinning >    ", enable=True, width=200)
-            pm.separator(style="single", height=2, width=160)
-
-            # text fields
-            pm.text(label="Root Bone", annotation="Name of the First Joint in the to be bound Joint Hierarchy")
-            skinRoot = cmds.textField(placeholderText="Name of First Bone", width=160)
-
-            pm.text(label="Mesh", annotation="Name of the Mesh that will be skinned to the Joint Hierarchy above")
-            skinMesh = cmds.textField(placeholderText="Mesh Name", width=160)
-
-            # (unbind) skin
-            pm.button("bt_skin", label="Bind Skin", width=100, height=30, enable=True,
-                      command=partial(skinning, skinRoot, skinMesh), backgroundColor=[0.45, 0.45, 0.45],
-                      annotation="Bind to: Joint Hierarchy, Bind Method: Closest in Hierarchy, Skinning Method: Dual-Quaternion")
-            pm.text(label=" Wheight Paint afterwards", enable=False)
-
-            pm.button("bt_unbindSkin", label="Unbind Skin", enable=True, width=100, height=30,
-                      command=partial(unbindSkin, skinMesh), backgroundColor=[0.4, 0.3, 0.3],
-                      annotation="Unbinds the Skinning of the 2 named objects above")
-            pm.text(label="Reset Skinning", enable=False)
-
-            pm.separator(style="none", height=5)
-            pm.showWindow(sk_win)
+            sk_win = fresh_window("sk_art", "Bipedal Rigging Tool", menuBar=True)
+            # (widget, name, flags) per GUI element, in layout order - name None lets Maya pick one
+            ui_widgets = {"menu": cmds.menu, "menuItem": cmds.menuItem, "text": cmds.text, "separator": cmds.separator,
+                          "optionMenu": cmds.optionMenu, "button": cmds.button, "checkBox": cmds.checkBox,
+                          "textField": cmds.textField}
+            ui_rows = (
+                # help menu
+                ("menu", "help_menu", dict(label="Help", helpMenu=True, enable=True)),
+                ("menuItem", "about_item", dict(label="About", command=aboutUI)),
+                ("menuItem", "func_item", dict(label="Function Overview", command=helpUI)),
+
+                # Locator section
+                ("text", None, dict(label="    < 1. Locator >    ", enable=True, width=200)),
+                ("separator", None, dict(style="single", height=2, width=160)),
+
+                # pose and hierarchy
+                ("optionMenu", "pose_option", dict(backgroundColor=[0.22, 0.22, 0.22], width=100, height=23)),
+                ("menuItem", None, dict(label="A-Pose")),
+                ("menuItem", None, dict(label="T-Pose")),
+
+                ("optionMenu", "hierarchy_option", dict(changeCommand=loc_solo_hierarchy_button, width=157, height=23)),
+                ("menuItem", None, dict(label="Move as Hierarchy")),
+                ("menuItem", None, dict(label="Move as Solo")),
+
+                # locators
+                ("button", "bt_locs", dict(label="Create Locators", width=100, height=30, enable=True,
+                                           command=partial(create_locator_hierarchy), backgroundColor=[0.45, 0.45, 0.45],
+                                           annotation="Create a Locator Hierarchy which can be customized upon creation, to fit the desired skeletal Proportion")),
+                ("text", None, dict(label=" Place where your joints are", enable=False)),
+
+                # mirror
+                ("button", "b_l_mirror", dict(label="Mirror L > R", width=100, height=30, enable=True,
+                                              command=partial(loc_mirror, "l"))),
+                ("button", "b_r_mirror", dict(label="Mirror R > L", width=103, height=30, enable=True,
+                                              command=partial(loc_mirror, "r"))),
+
+                # Skeleton section
+                ("text", None, dict(label="    < 2. Skeleton >    ", enable=True, width=200)),
+                ("separator", None, dict(style="single", height=1, width=160)),
+
+                # skeleton
+                ("button", "bt_bones", dict(label="Create Skeleton", width=100, height=30, enable=True,
+                                            command=create_joint_hierarchy, backgroundColor=[0.45, 0.45, 0.45],
+                                            annotation="Create a Joint Hierarchy according to the Locator Positions with basic XYZ Joint Orientations, WITHOUT single corrections")),
+                ("text", None, dict(label=" Check orientations afterwards", enable=False)),
+
+                # controls
+                ("button", "bt_ctrls", dict(label="Create IK Controls", enable=True, command=ctrl_creation, width=100,
+                                            height=30, backgroundColor=[0.45, 0.45, 0.45],
+                                            annotation="Create IK Controls for Arms/Fingers, Legs/Feet, Head and Spine (IK Spline)")),
+                ("separator", None, dict(style="none", height=2)),
+
+                # toggle
+                ("checkBox", None, dict(label=" Toggle Local Rotation Axes", changeCommand=toggleTransforms, width=200,
+                                        annotation="Toggles the 'Display Local Rotation Axes'-control on all visible objects of the rig groups")),
+                ("text", None, dict(label="")),
+
+                # resets
+                ("button", "bt_resetLocs", dict(label="Reset to Locators", enable=True, command=reset_locs, width=100, height=30,
+                                                backgroundColor=[0.4, 0.3, 0.3],
+                                                annotation="Deletes everything the tool created, except the Locator Hierarchy to make further placement adjustments")),
+                ("text", None, dict(label="Delete Joint Hierarchy", enable=False)),
+
+                ("button", "bt_resetJnts", dict(label="Reset to Skeleton", enable=True, command=reset_jnts, width=100, height=30,
+                                                backgroundColor=[0.4, 0.3, 0.3],
+                                                annotation="Deletes the Control Rig to make furthere adjustments to the base skeleton")),
+                ("text", None, dict(label="Delete Control Rig", enable=False)),
+
+                ("separator", None, dict(style="none", height=1)),
+                ("separator", None, dict(style="none", height=1)),
+
+                # Skinning
+                ("text", None, dict(label="    < Skinning >    ", enable=True, width=200)),
+                ("separator", None, dict(style="single", height=2, width=160)),
+
+                # text fields
+                ("text", None, dict(label="Root Bone", annotation="Name of the First Joint in the to be bound Joint Hierarchy")),
+                ("textField", "tf_skinRoot", dict(placeholderText="Name of First Bone", width=160)),
+
+                ("text", None, dict(label="Mesh", annotation="Name of the Mesh that will be skinned to the Joint Hierarchy above")),
+                ("textField", "tf_skinMesh", dict(placeholderText="Mesh Name", width=160)),
+
+                # (unbind) skin
+                ("button", "bt_skin", dict(label="Bind Skin", width=100, height=30, enable=True,
+                                           command=partial(skinning, "tf_skinRoot", "tf_skinMesh"), backgroundColor=[0.45, 0.45, 0.45],
+                                           annotation="Bind to: Joint Hierarchy, Bind Method: Closest in Hierarchy, Skinning Method: Dual-Quaternion")),
+                ("text", None, dict(label=" Wheight Paint afterwards", enable=False)),
+
+                ("button", "bt_unbindSkin", dict(label="Unbind Skin", enable=True, width=100, height=30,
+                                                 command=partial(unbindSkin, "tf_skinMesh"), backgroundColor=[0.4, 0.3, 0.3],
+                                                 annotation="Unbinds the Skinning of the 2 named objects above")),
+                ("text", None, dict(label="Reset Skinning", enable=False)),
+
+                ("separator", None, dict(style="none", height=5)),
+            )
+
+            cmds.rowColumnLayout(numberOfColumns=2, columnSpacing=[(1, 1), (2, 7)],
+                                 columnOffset=[(1, "both", 22), (2, "left", 22)], columnWidth=[(1, 100), (2, 200)],
+                                 rowSpacing=(1, 22), columnAlign=[(1, "left"), (2, "left")])
+            for (ui_kind, ui_name, ui_flags) in ui_rows:
+                if ui_name:
+                    ui_widgets[ui_kind](ui_name, **ui_flags)
+                else:
+                    ui_widgets[ui_kind](**ui_flags)
+            cmds.showWindow(sk_win)
 
         # execute upon executing cmds.sk_biped_RiggingTool()
         artUI()
@@ -1791,11 +2058,16 @@ def cmdCreator():
     return omx.asMPxPtr(SK_RT())
 
 
+# command syntax, the command takes no flags or arguments
+def syntaxCreator():
+    return om.MSyntax()
+
+
 # initialize the script plug-in
 def initializePlugin(mobject):
     pluginFn = omx.MFnPlugin(mobject)
     try:
-        pluginFn.registerCommand(kPluginCmdName, SK_RT)
+        pluginFn.registerCommand(kPluginCmdName, cmdCreator, syntaxCreator)
     except:
         sys.stderr.write("Failed to register command: " + kPluginCmdName)
 